@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Local HTTP service for document processing, built on asyncio only.
+
+    POST /jobs?name=<file name>     body: the raw document -> 202 {"job_id", "status"}
+    GET  /jobs/<job_id>             -> job status
+    GET  /jobs/<job_id>/result      -> pages and document-level fields once done
+    GET  /health                    -> queue and worker counters
+
+Submitted jobs wait in a bounded queue; when it is full, POST /jobs answers
+429 with a Retry-After header instead of accepting more work. Documents are
+processed in a pool of warm worker processes, so the event loop only does I/O;
+if a worker dies, its job fails and the pool is replaced.
+Run from the repository root: python -m api.server --port 8000 --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+import uuid
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import parse_qs, urlsplit
+
+from core.processor import DEFAULT_WORKERS, SUPPORTED_EXTENSIONS, create_worker_pool, process_document_iter
+from core.parsing.registry import parser_registry
+from core.output.json_output import dumps
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+MAX_QUEUED_JOBS = 32
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+# Finished jobs are forgotten after this many seconds
+RESULT_TTL_SECONDS = 15 * 60
+RETRY_AFTER_SECONDS = 2
+MAX_HEADER_BYTES = 16 * 1024
+
+STATUS_TEXT = {
+    200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 429: "Too Many Requests", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+
+def process_job(data, name):
+    """
+    Runs in a worker process: processes one uploaded document from memory
+    and returns its result already serialized, so only bytes travel back
+    to the event loop.
+    """
+    parse_state = parser_registry.start_document()
+    pages = list(process_document_iter(data, parse_state=parse_state, name=name))
+    document = parse_state.finish()
+    return dumps({
+        "pages": pages,
+        "document": {
+            "document_type": document.doc_type,
+            "parsed_fields": document.fields,
+            "parsed_field_boxes": document.field_boxes,
+        },
+    })
+
+class Job:
+    def __init__(self, name, data):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.data = data
+        self.status = "queued"
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.result = None
+        self.error = None
+
+    def describe(self):
+        info = {"job_id": self.id, "name": self.name, "status": self.status, "submitted": self.submitted}
+        if self.started:
+            info["started"] = self.started
+        if self.finished:
+            info["finished"] = self.finished
+            info["seconds"] = round(self.finished - (self.started or self.submitted), 3)
+        if self.error:
+            info["error"] = self.error
+        return info
+
+class DocumentService:
+    """
+    Job store, bounded queue and worker pool behind the HTTP handlers.
+    One consumer task per worker takes jobs off the queue, so at most
+    `workers` documents are in the pool and at most `queue_size` wait.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, queue_size=MAX_QUEUED_JOBS):
+        self.workers = workers
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.jobs = {}
+        self.pool = None
+        self.consumers = []
+        self.rejected = 0
+        self.pool_restarts = 0
+
+    async def start(self):
+        self.pool = create_worker_pool(self.workers)
+        self.consumers = [asyncio.create_task(self._consume()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self.consumers:
+            task.cancel()
+        await asyncio.gather(*self.consumers, return_exceptions=True)
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    def submit(self, name, data):
+        """Queues a document; returns the Job, or None when the queue is full."""
+        self._expire()
+        if self.queue.full():
+            self.rejected += 1
+            return None
+        job = Job(name, data)
+        self.jobs[job.id] = job
+        self.queue.put_nowait(job)
+        return job
+
+    def get(self, job_id):
+        self._expire()
+        return self.jobs.get(job_id)
+
+    def _expire(self):
+        # Runs on every submit, lookup, health check and finished job, so
+        # results are dropped on time even if nobody polls for them
+        cutoff = time.time() - RESULT_TTL_SECONDS
+        for job_id in [j.id for j in self.jobs.values() if j.finished and j.finished < cutoff]:
+            del self.jobs[job_id]
+
+    async def _consume(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self.queue.get()
+            job.status = "running"
+            job.started = time.time()
+            pool = self.pool
+            try:
+                job.result = await loop.run_in_executor(pool, process_job, job.data, job.name)
+                job.status = "done"
+            except BrokenProcessPool as e:
+                # A worker died (e.g. OOM-killed); every job in the pool fails with it
+                job.error = f"{type(e).__name__}: {e}"
+                job.status = "failed"
+                self._restart_pool(pool)
+            except Exception as e:
+                job.error = f"{type(e).__name__}: {e}"
+                job.status = "failed"
+            finally:
+                job.finished = time.time()
+                job.data = None
+                self.queue.task_done()
+                self._expire()
+
+    def _restart_pool(self, broken):
+        # Consumers whose jobs died with the same pool restart it only once
+        if self.pool is not broken:
+            return
+        print(f"Worker pool broke; restarting it with {self.workers} worker(s)")
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.pool = create_worker_pool(self.workers)
+        self.pool_restarts += 1
+
+    def stats(self):
+        self._expire()
+        counts = {}
+        for job in self.jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            "workers": self.workers,
+            "queued": self.queue.qsize(),
+            "queue_size": self.queue.maxsize,
+            "jobs": counts,
+            "rejected": self.rejected,
+            "pool_restarts": self.pool_restarts,
+        }
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+async def read_request(reader):
+    """Returns (method, path, query, headers, body) of one HTTP/1.1 request, or None at EOF."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError:
+        raise HttpError(431, "request headers too large")
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, _ = lines[0].split(" ", 2)
+    except ValueError:
+        raise HttpError(400, "malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            key, value = line.split(":", 1)
+            headers[key.strip().lower()] = value.strip()
+    length = headers.get("content-length", "0").strip() or "0"
+    if not length.isdigit():
+        raise HttpError(400, "invalid Content-Length")
+    length = int(length)
+    if length > MAX_UPLOAD_BYTES:
+        raise HttpError(413, f"upload larger than {MAX_UPLOAD_BYTES} bytes")
+    body = await reader.readexactly(length) if length else b""
+    url = urlsplit(target)
+    return method.upper(), url.path, parse_qs(url.query), headers, body
+
+async def write_response(writer, status, payload=None, body=None, headers=None):
+    if body is None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    lines = [
+        f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+        "Content-Type: application/json; charset=utf-8",
+        f"Content-Length: {len(body)}",
+    ]
+    for key, value in (headers or {}).items():
+        lines.append(f"{key}: {value}")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+
+def route(service, method, path, query, headers, body):
+    """Returns (status, payload, raw_body, extra_headers) for one request."""
+    parts = [p for p in path.split("/") if p]
+    if parts == ["health"]:
+        return 200, service.stats(), None, None
+    if parts == ["jobs"]:
+        if method != "POST":
+            raise HttpError(405, "use POST to submit a document")
+        name = (query.get("name") or [headers.get("x-filename", "")])[0]
+        _, extension = os.path.splitext(name.lower())
+        if extension not in SUPPORTED_EXTENSIONS:
+            raise HttpError(400, f"unsupported file type '{extension}'; pass ?name=<file name>")
+        if not body:
+            raise HttpError(400, "empty upload")
+        job = service.submit(os.path.basename(name), body)
+        if job is None:
+            return 429, {"error": "job queue is full"}, None, {"Retry-After": RETRY_AFTER_SECONDS}
+        return 202, {"job_id": job.id, "status": job.status}, None, {"Location": f"/jobs/{job.id}"}
+    if len(parts) in (2, 3) and parts[0] == "jobs" and parts[2:] in ([], ["result"]):
+        if method != "GET":
+            raise HttpError(405, "use GET")
+        job = service.get(parts[1])
+        if job is None:
+            raise HttpError(404, "unknown job")
+        if len(parts) == 2:
+            return 200, job.describe(), None, None
+        if job.status == "done":
+            return 200, None, job.result, None
+        if job.status == "failed":
+            return 500, job.describe(), None, None
+        return 202, job.describe(), None, {"Retry-After": 1}
+    raise HttpError(404, "not found")
+
+def make_handler(service):
+    async def handle(reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                    if request is None:
+                        break
+                    method, path, query, headers, body = request
+                    status, payload, raw, extra = route(service, method, path, query, headers, body)
+                    await write_response(writer, status, payload, raw, extra)
+                    if headers.get("connection", "").lower() == "close":
+                        break
+                except HttpError as e:
+                    await write_response(writer, e.status, {"error": str(e)}, headers={"Connection": "close"})
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    return handle
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=DEFAULT_WORKERS, queue_size=MAX_QUEUED_JOBS):
+    service = DocumentService(workers=workers, queue_size=queue_size)
+    await service.start()
+    server = await asyncio.start_server(make_handler(service), host, port, limit=MAX_HEADER_BYTES)
+    print(f"Serving on http://{host}:{port} with {workers} worker(s), queue size {queue_size}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="BharatDoc AI-OCR local HTTP service")
+    parser.add_argument("--host", type=str, default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Worker processes for document processing.")
+    parser.add_argument("--queue-size", type=int, default=MAX_QUEUED_JOBS, help="Jobs that may wait before submissions get 429.")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.queue_size))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
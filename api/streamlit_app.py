@@ -1,9 +1,7 @@
 import streamlit as st
-import tempfile
 import os
-from core.processor_simple import process_document
-from core.output.json_output import write_json
-from core.output.csv_output import write_kv_csv, write_tables_csv
+from core.output.archive import page_file_names
+from api.streamlit_cache import build_downloads, load_engines, process_upload, upload_digest
 
 st.set_page_config(page_title="BharatDoc AI-OCR", layout="wide")
 st.title("🇮🇳 BharatDoc AI-OCR")
@@ -12,14 +10,17 @@ st.write("Upload Indian financial/legal documents (PDF, image) for OCR, parsing,
 uploaded_files = st.file_uploader("Upload PDF or image files", type=["pdf", "png", "jpg", "jpeg", "tiff", "bmp"], accept_multiple_files=True)
 
 if uploaded_files:
+    load_engines()
     for uploaded_file in uploaded_files:
         st.subheader(f"Results for: {uploaded_file.name}")
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[1]) as tmp:
-            tmp.write(uploaded_file.read())
-            tmp_path = tmp.name
-        # Process document
+        # Process document straight from the upload buffer
+        data = uploaded_file.getvalue()
         with st.spinner("Processing..."):
-            results = process_document(tmp_path)
+            digest = upload_digest(data)
+            results = process_upload(digest, uploaded_file.name, data)
+        files, archive = build_downloads(digest, uploaded_file.name, results)
+        base = os.path.splitext(uploaded_file.name)[0]
+        st.download_button("Download all (ZIP)", data=archive, file_name=f"{base}.zip", mime="application/zip")
         # Display results
         for page in results:
             st.markdown(f"### Page {page['page_number']} ({page['type']})")
@@ -38,21 +39,9 @@ if uploaded_files:
             if page.get("low_confidence_blocks"):
                 st.write(f"**Low Confidence Blocks:** {len(page['low_confidence_blocks'])}")
             # Download buttons
-            base = os.path.splitext(uploaded_file.name)[0]
-            json_name = f"{base}_page{page['page_number']}.json"
-            csv_name = f"{base}_page{page['page_number']}.csv"
-            # Save to temp for download
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as jf:
-                write_json(page, jf.name)
-                st.download_button("Download JSON", data=open(jf.name, "rb").read(), file_name=json_name)
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as cf:
-                write_kv_csv(page.get("parsed_fields", {}), cf.name)
-                st.download_button("Download CSV (Fields)", data=open(cf.name, "rb").read(), file_name=csv_name)
+            names = page_file_names(base, page)
+            st.download_button("Download JSON", data=files[names["json"]], file_name=names["json"])
+            st.download_button("Download CSV (Fields)", data=files[names["csv"]], file_name=names["csv"])
             # Table CSVs
-            if page.get("tables"):
-                for idx, table in enumerate(page["tables"], 1):
-                    tname = f"{base}_page{page['page_number']}_table{idx}.csv"
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as tf:
-                        write_tables_csv([table], tf.name[:-4])  # tf.name includes .csv
-                        st.download_button(f"Download Table {idx} CSV", data=open(tf.name, "rb").read(), file_name=tname)
-        os.remove(tmp_path) 
\ No newline at end of file
+            for idx, tname in enumerate(names["tables"], 1):
+                st.download_button(f"Download Table {idx} CSV", data=files[tname], file_name=tname)
@@ -0,0 +1,36 @@
+"""
+Cached processing shared by the Streamlit apps (api/streamlit_app.py and
+streamlit_app_cloud.py).
+"""
+
+import hashlib
+import os
+import streamlit as st
+from core.processor_simple import process_document, warm_up
+from core.output.archive import iter_document_files, zip_files
+
+# Every widget interaction reruns the app script; results are cached per
+# upload content so expanding or downloading never reprocesses a document.
+RESULT_CACHE_ENTRIES = 32
+RESULT_CACHE_TTL_SECONDS = 60 * 60
+
+@st.cache_resource(show_spinner="Loading models...")
+def load_engines():
+    """Loads the processing models once per server process, shared by all sessions."""
+    warm_up()
+    return True
+
+def upload_digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, ttl=RESULT_CACHE_TTL_SECONDS, show_spinner=False)
+def process_upload(digest, name, _data):
+    # Keyed by (digest, name); the upload bytes themselves are not hashed again
+    return process_document(_data, name=name)
+
+@st.cache_data(max_entries=RESULT_CACHE_ENTRIES, ttl=RESULT_CACHE_TTL_SECONDS, show_spinner=False)
+def build_downloads(digest, name, _results):
+    """Every download payload of an upload, serialized in memory once per upload."""
+    base = os.path.splitext(name)[0]
+    files = dict(iter_document_files(base, _results))
+    return files, zip_files(files.items())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: page serialization with the previous pretty-printed
+json.dump against the compact writer (orjson when installed, else the
+standard library), with and without gzip.
+Run from the repository root: python benchmarks/bench_output.py --pages 200 --blocks 800
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from core.layout.table import LayoutTable
+from core.output import json_output
+from core.output.json_output import dumps, json_default
+
+WORDS = ["Name", "of", "Enterprise", "ACME", "Traders", "Date", "01/04/2019", "Balance",
+         "12,450.00", "NEFT", "Transfer", "Mumbai", "उद्यम", "पंजीकरण", "Total", "Cr", "Dr"]
+
+def make_page(page_number, n_blocks, rng):
+    x0 = np.array([rng.uniform(0, 500) for _ in range(n_blocks)], dtype=np.float32)
+    y0 = np.array([rng.uniform(0, 800) for _ in range(n_blocks)], dtype=np.float32)
+    bboxes = np.stack([x0, y0, x0 + 40, y0 + 12], axis=1)
+    layout = LayoutTable.from_columns(
+        bboxes, [rng.choice(WORDS) for _ in range(n_blocks)], ["en"] * n_blocks,
+        [rng.uniform(0.5, 1.0) for _ in range(n_blocks)],
+    )
+    return {
+        "page_number": page_number, "type": "digital_pdf_page", "layout": layout,
+        "watermark_blocks": [], "redacted_items": [], "low_confidence_blocks": list(range(0, n_blocks, 7)),
+        "text": " ".join(layout.texts), "document_type": "Unknown", "parsed_fields": {}, "tables": [],
+    }
+
+def legacy(pages):
+    return [json.dumps(p, ensure_ascii=False, indent=2, default=json_default).encode("utf-8") for p in pages]
+
+def compact(pages):
+    return [dumps(p) for p in pages]
+
+def compact_stdlib(pages):
+    fast, json_output.orjson = json_output.orjson, None
+    try:
+        return [dumps(p) for p in pages]
+    finally:
+        json_output.orjson = fast
+
+def compact_gzip(pages):
+    return [gzip.compress(dumps(p), compresslevel=6) for p in pages]
+
+def timeit(fn, arg, repeat):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best, sum(len(b) for b in out)
+
+def main():
+    parser = argparse.ArgumentParser(description="Output serialization micro-benchmark")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--blocks", type=int, default=800, help="Layout blocks per page.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    pages = [make_page(i + 1, args.blocks, rng) for i in range(args.pages)]
+    print(f"{args.pages} pages x {args.blocks} blocks (orjson {'installed' if json_output.orjson else 'not installed'})")
+    base, _ = timeit(legacy, pages, args.repeat)
+    for label, fn in [("pretty json.dump (previous)", legacy), ("compact, stdlib", compact_stdlib),
+                      ("compact", compact), ("compact + gzip", compact_gzip)]:
+        seconds, size = timeit(fn, pages, args.repeat)
+        print(f"  {label:<28} {seconds:8.3f}s  {args.pages / seconds:8.1f} pages/sec  {size / 1e6:7.2f} MB  ({base / seconds:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: single-pass, page-level redaction vs. the previous
+per-pattern, per-block loop.
+Run from the repository root: python benchmarks/bench_redaction.py --blocks 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.postprocessing.redact import REDACTED_STR, REDACTION_PATTERNS, redact_blocks, redact_text
+
+def legacy_redact_text(text):
+    """The previous implementation: findall per pattern, str.replace per match."""
+    redacted = text
+    found = []
+    for label, pattern in REDACTION_PATTERNS:
+        for m in pattern.findall(text):
+            found.append((label, m))
+            redacted = redacted.replace(m, REDACTED_STR)
+    return redacted, found
+
+def legacy_redact_blocks(layout_blocks):
+    redacted_blocks = []
+    all_found = []
+    for block in layout_blocks:
+        redacted_text, found = legacy_redact_text(block["text"])
+        new_block = block.copy()
+        new_block["text"] = redacted_text
+        redacted_blocks.append(new_block)
+        all_found.extend(found)
+    return redacted_blocks, all_found
+
+WORDS = ["Name", "of", "Enterprise", "ACME", "Traders", "Date", "01/04/2019", "Balance",
+         "12,450.00", "NEFT", "Transfer", "Mumbai", "उद्यम", "पंजीकरण", "Total", "Cr", "Dr"]
+SENSITIVE = ["ABCDE1234F", "1234 5678 9012", "UDYAM-UP-01-0000001", "123456789012345"]
+
+def make_blocks(n, sensitive_ratio, seed=0):
+    rng = random.Random(seed)
+    blocks = []
+    for i in range(n):
+        text = rng.choice(SENSITIVE) if rng.random() < sensitive_ratio else rng.choice(WORDS)
+        blocks.append({"bbox": [i, 0, i + 10, 10], "text": text, "language": "en", "confidence": 1.0})
+    return blocks
+
+def timeit(fn, arg, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Redaction micro-benchmark")
+    parser.add_argument("--blocks", type=int, default=100000, help="Word blocks per page")
+    parser.add_argument("--sensitive-ratio", type=float, default=0.02, help="Fraction of blocks with sensitive data")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    blocks = make_blocks(args.blocks, args.sensitive_ratio)
+    page_text = " ".join(b["text"] for b in blocks)
+
+    # Same output as before on this corpus: no value is split across blocks and
+    # no patterns overlap, which is where the new scan (intentionally) differs
+    assert [b["text"] for b in redact_blocks(blocks[:2000])[0]] == \
+        [b["text"] for b in legacy_redact_blocks(blocks[:2000])[0]]
+
+    print(f"{args.blocks} blocks, {len(page_text)} characters of page text")
+    for name, fn, arg in [
+        ("legacy redact_blocks", legacy_redact_blocks, blocks),
+        ("redact_blocks", redact_blocks, blocks),
+        ("legacy redact_text (page)", legacy_redact_text, page_text),
+        ("redact_text (page)", redact_text, page_text),
+    ]:
+        print(f"  {name:<28} {timeit(fn, arg, args.repeat) * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
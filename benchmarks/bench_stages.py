@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Stage-level benchmark of core.processor on the synthetic corpus
+(benchmarks/corpus.py), with the fake OCR backend (benchmarks/fake_ocr.py)
+so no OCR models are needed. For each stage it reports pages/sec, p50/p95
+per-page latency and peak RSS:
+
+    text         text-layer parse (words + textpage), every page
+    layout       digital layout table with script/language tagging
+    tables       table pre-check and pdfplumber extraction
+    render       page rasterization for OCR, scanned pages
+    ocr          OCR (fake backend) and OCR layout table, scanned pages
+    postprocess  watermark flagging, redaction, confidence flags
+    parse        document-type routing and field parsing
+    serialize    compact JSON of the finished page
+    pipeline     process_document_iter end to end (time between pages)
+
+Each stage runs in its own process, so its peak RSS is not inflated by the
+stages before it; inputs a stage needs are prepared untimed. "growth" is
+the peak RSS above the process's level after imports and OCR warm-up
+(untimed input preparation included).
+Run from the repository root: python benchmarks/bench_stages.py --corpus bench_corpus --pages 8
+"""
+
+import argparse
+import contextlib
+import glob
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STAGES = ["text", "layout", "tables", "render", "ocr", "postprocess", "parse", "serialize", "pipeline"]
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def run_stage(stage, paths):
+    """Runs one stage over every page of the documents; returns per-page seconds."""
+    import fitz
+    from core import processor as p
+    from core.output.json_output import dumps
+    from core.parsing.registry import parser_registry
+
+    if stage == "pipeline":
+        seconds = []
+        for path in paths:
+            start = time.perf_counter()
+            for _ in p.process_document_iter(path):
+                now = time.perf_counter()
+                seconds.append(now - start)
+                start = now
+        return seconds
+
+    def page_data(page, page_num, words, textpage, digital, get_plumber_page):
+        if digital:
+            return p._process_digital_page(page, page_num, words, textpage, get_plumber_page)
+        return p._process_scanned_pages([page], [page_num], [p._choose_render_dpi(page, words)])[0]
+
+    seconds = []
+    for path in paths:
+        doc = fitz.open(path)
+        plumber = None
+        parse_state = parser_registry.start_document()
+
+        def get_plumber_page(page_num):
+            nonlocal plumber
+            if plumber is None:
+                plumber = p._open_plumber(path)
+            return plumber.pages[page_num]
+
+        for page_num, page in enumerate(doc):
+            if stage == "text":
+                (words, textpage), elapsed = _timed(p._extract_page_words, page)
+                seconds.append(elapsed)
+                continue
+            words, textpage = p._extract_page_words(page)
+            digital = p._text_length(words) >= p.MIN_TEXT_LENGTH_FOR_DIGITAL
+            if stage == "layout" and digital:
+                seconds.append(_timed(p._extract_digital_pdf_layout, page, words, textpage)[1])
+            elif stage == "tables" and digital:
+                start = time.perf_counter()
+                if p._page_may_have_tables(page):
+                    p._extract_tables_from_pdfplumber(get_plumber_page(page_num))
+                seconds.append(time.perf_counter() - start)
+            elif stage == "render" and not digital:
+                seconds.append(_timed(p._convert_page_to_image, page, None, words)[1])
+            elif stage == "ocr" and not digital:
+                dpi = p._choose_render_dpi(page, words)
+                image = p._convert_page_to_image(page, dpi)
+                start = time.perf_counter()
+                p._extract_ocr_layout_blocks(p.ocr_engine_manager.extract_text_from_images([image])[0], 72 / dpi)
+                seconds.append(time.perf_counter() - start)
+            elif stage == "postprocess":
+                line_ids = None
+                if digital:
+                    layout = p._extract_digital_pdf_layout(page, words, textpage)
+                    line_ids = p._word_line_ids(words)
+                else:
+                    dpi = p._choose_render_dpi(page, words)
+                    image = p._convert_page_to_image(page, dpi)
+                    layout = p._extract_ocr_layout_blocks(p.ocr_engine_manager.extract_text_from_images([image])[0], 72 / dpi)
+                    line_ids = p.block_line_ids(layout)
+                seconds.append(_timed(p._postprocess_layout, layout, line_ids)[1])
+            elif stage == "parse":
+                data = page_data(page, page_num, words, textpage, digital, get_plumber_page)
+                seconds.append(_timed(p._finish_page, data, parse_state)[1])
+            elif stage == "serialize":
+                data = p._finish_page(page_data(page, page_num, words, textpage, digital, get_plumber_page), parse_state)
+                seconds.append(_timed(dumps, data)[1])
+        if plumber is not None:
+            plumber.close()
+        doc.close()
+    return seconds
+
+def child(args):
+    """Stage process: prints one JSON line with the stage's measurements."""
+    from benchmarks.fake_ocr import fake_engine_factory
+    from core.ocr.engine import ocr_engine_manager
+    from core.processor_simple import warm_up
+
+    ocr_engine_manager.set_engine_factory(fake_engine_factory(args.line_ms))
+    ocr_engine_manager.preload(["en"])
+    # One-time model loads (language profiles, parser patterns) stay out of the timings
+    warm_up()
+    paths = json.loads(args.paths)
+    base_rss = peak_rss_mb()
+    # The pipeline reports every page on stdout
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        seconds = run_stage(args.stage, paths)
+    print(json.dumps({"stage": args.stage, "seconds": seconds, "base_rss_mb": base_rss, "peak_rss_mb": peak_rss_mb()}))
+
+def corpus_paths(args):
+    from benchmarks.corpus import generate_corpus
+    paths = sorted(glob.glob(os.path.join(args.corpus, "*.pdf")))
+    if args.regenerate or not paths:
+        print(f"Generating corpus in {args.corpus} ({args.pages} pages per document)")
+        paths = sorted(generate_corpus(args.corpus, args.pages, seed=args.seed))
+    if args.documents:
+        wanted = set(args.documents.split(","))
+        paths = [path for path in paths if os.path.splitext(os.path.basename(path))[0] in wanted]
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-stage processing benchmark on a synthetic corpus")
+    parser.add_argument("--corpus", type=str, default="bench_corpus", help="Corpus directory; generated if empty.")
+    parser.add_argument("--pages", type=int, default=8, help="Pages per generated document.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--regenerate", action="store_true", help="Rebuild the corpus even if it exists.")
+    parser.add_argument("--documents", type=str, help="Comma-separated corpus names to include, e.g. udyam,scanned_200dpi")
+    parser.add_argument("--stages", type=str, default=",".join(STAGES), help="Comma-separated stages to run.")
+    parser.add_argument("--line-ms", type=float, default=0.0, help="Simulated fake-OCR cost per text line, in ms.")
+    parser.add_argument("--json", type=str, help="Also write the raw results to this file.")
+    parser.add_argument("--stage", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--paths", type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.stage:
+        child(args)
+        return
+
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)}")
+    paths = corpus_paths(args)
+    if not paths:
+        parser.error("no documents selected")
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    print(f"{len(paths)} documents: {', '.join(os.path.basename(p) for p in paths)} (fake OCR, {args.line_ms} ms/line)")
+    print(f"  {'stage':<12} {'pages':>6} {'pages/sec':>10} {'p50 ms':>9} {'p95 ms':>9} {'peak RSS MB':>12} {'growth':>8}")
+    results = []
+    for stage in stages:
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--stage", stage, "--paths", json.dumps(paths),
+             "--line-ms", str(args.line_ms)],
+            cwd=root, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            print(f"  {stage:<12} FAILED\n{proc.stderr}")
+            continue
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        results.append(result)
+        seconds = result["seconds"]
+        total = sum(seconds)
+        print(f"  {stage:<12} {len(seconds):>6} {len(seconds) / total if total else 0:>10.1f} "
+              f"{percentile(seconds, 0.5) * 1000:>9.2f} {percentile(seconds, 0.95) * 1000:>9.2f} "
+              f"{result['peak_rss_mb']:>12.1f} {result['peak_rss_mb'] - result['base_rss_mb']:>8.1f}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"documents": paths, "line_ms": args.line_ms, "stages": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic corpus of Indian-style documents for benchmarks,
+generated with PyMuPDF only (no fonts or sample files needed):
+
+    udyam.pdf               digital Udyam registration certificates
+    devanagari.pdf          digital Hindi (Devanagari) notices; the text layer
+                            extracts as exact Unicode, but glyphs are drawn
+                            unshaped (no conjuncts or matra reordering)
+    statement.pdf           table-heavy bank statements with ruled cells
+    scanned_<dpi>dpi.pdf    the above rasterized to images (no text layer)
+
+The same seed always gives the same documents, so runs are comparable.
+Run from the repository root: python benchmarks/corpus.py --outdir bench_corpus --pages 8
+"""
+
+import argparse
+import os
+import random
+import re
+
+import fitz
+
+DEFAULT_PAGES = 8
+# Resolutions of the rasterized "scanned" documents
+SCAN_DPIS = (100, 150, 200, 300)
+A4 = fitz.paper_rect("a4")
+MARGIN = 50
+FONT_SIZE = 10
+LINE_HEIGHT = 16
+
+STATES = ["MH", "DL", "KA", "TN", "GJ", "UP", "WB", "RJ"]
+FIRST_NAMES = ["Ramesh", "Priya", "Anil", "Sunita", "Vikram", "Lakshmi", "Arjun", "Meena"]
+LAST_NAMES = ["Kumar", "Sharma", "Patel", "Iyer", "Reddy", "Singh", "Das", "Nair"]
+BUSINESSES = ["Traders", "Enterprises", "Textiles", "Foods", "Engineering Works", "Agro Industries"]
+ORGANIZATIONS = ["Proprietary", "Partnership", "Private Limited Company", "Hindu Undivided Family"]
+NARRATIONS = ["NEFT TRANSFER", "UPI PAYMENT", "ATM WITHDRAWAL", "SALARY CREDIT", "GST PAYMENT",
+              "CHEQUE DEPOSIT", "IMPS TRANSFER", "EMI DEBIT"]
+HINDI_LINES = [
+    "उद्यम पंजीकरण प्रमाणपत्र",
+    "उद्यम का नाम: {business}",
+    "स्वामी का नाम: {owner}",
+    "पंजीकरण संख्या: {number}",
+    "यह प्रमाणित किया जाता है कि उपरोक्त उद्यम सूक्ष्म, लघु एवं मध्यम",
+    "उद्यम मंत्रालय के अंतर्गत पंजीकृत है।",
+    "पता: {city}, भारत",
+    "दिनांक: {date}",
+]
+# MuPDF's bundled Noto Serif Devanagari (UCDN script 9); Latin runs use Helvetica
+DEVANAGARI_SCRIPT = 9
+LATIN_RUN = re.compile(r"[A-Za-z][A-Za-z0-9 .,&'/-]*[A-Za-z0-9]|[A-Za-z]")
+HINDI_CITIES = ["मुंबई", "दिल्ली", "बेंगलुरु", "चेन्नई", "अहमदाबाद", "लखनऊ", "कोलकाता", "जयपुर"]
+BOILERPLATE = (
+    "This certificate is issued under the Micro, Small and Medium Enterprises Development Act, 2006. "
+    "The enterprise is required to update its details on the Udyam portal every financial year. "
+)
+
+def _owner(rng):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+def _udyam_number(rng):
+    return f"UDYAM-{rng.choice(STATES)}-{rng.randint(1, 40):02d}-{rng.randint(0, 9999999):07d}"
+
+def _date(rng):
+    return f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{rng.randint(2015, 2024)}"
+
+def _write_lines(page, lines, y=MARGIN + 40):
+    for line in lines:
+        page.insert_text((MARGIN, y), line, fontsize=FONT_SIZE, fontname="helv")
+        y += LINE_HEIGHT
+    return y
+
+def udyam_page(page, rng):
+    owner = _owner(rng)
+    page.insert_text((MARGIN, MARGIN + 10), "Udyam Registration Certificate", fontsize=16, fontname="hebo")
+    y = _write_lines(page, [
+        f"Udyam Registration Number: {_udyam_number(rng)}",
+        f"Name of Enterprise: {owner.split()[1]} {rng.choice(BUSINESSES)}",
+        f"Name of Owner: {owner}",
+        f"Type of Organization: {rng.choice(ORGANIZATIONS)}",
+        f"Date of Commencement: {_date(rng)}",
+        f"Major Activity: {rng.choice(['Manufacturing', 'Services'])}",
+        f"Mobile: +91 {rng.randint(6000000000, 9999999999)}",
+    ])
+    page.insert_textbox(fitz.Rect(MARGIN, y + 10, A4.width - MARGIN, y + 200), BOILERPLATE * 3,
+                        fontsize=FONT_SIZE, fontname="helv")
+
+def _devanagari_font():
+    font = fitz.Font(script=DEVANAGARI_SCRIPT)
+    if not font.has_glyph(ord("उ")):
+        raise RuntimeError("this PyMuPDF build has no bundled Devanagari font")
+    return font
+
+def _insert_runs(page, point, text, font, fontsize):
+    """
+    Draws one line with the page's "deva" font (see devanagari_page),
+    switching to Helvetica for Latin runs. The embedded font carries a
+    ToUnicode map, so the words extract as the original Unicode text.
+    """
+    x, y = point
+    pos = 0
+    runs = []
+    for m in LATIN_RUN.finditer(text):
+        runs += [(text[pos:m.start()], False), (m.group(), True)]
+        pos = m.end()
+    runs.append((text[pos:], False))
+    for run, latin in runs:
+        if not run:
+            continue
+        if latin:
+            page.insert_text((x, y), run, fontname="helv", fontsize=fontsize)
+            x += fitz.get_text_length(run, "helv", fontsize)
+        else:
+            page.insert_text((x, y), run, fontname="deva", fontsize=fontsize)
+            x += font.text_length(run, fontsize)
+
+def devanagari_page(page, rng):
+    values = {
+        "business": f"{rng.choice(LAST_NAMES)} {rng.choice(BUSINESSES)}",
+        "owner": _owner(rng),
+        "number": _udyam_number(rng),
+        "city": rng.choice(HINDI_CITIES),
+        "date": _date(rng),
+    }
+    font = _devanagari_font()
+    page.insert_font(fontname="deva", fontbuffer=font.buffer)
+    y = MARGIN + 10
+    for line in HINDI_LINES * 4:
+        _insert_runs(page, (MARGIN, y), line.format(**values), font, 11)
+        y += LINE_HEIGHT + 2
+
+def statement_page(page, rng, rows=36):
+    page.insert_text((MARGIN, MARGIN + 10), "Statement of Account", fontsize=14, fontname="hebo")
+    _write_lines(page, [f"Account Holder: {_owner(rng)}", f"Account No: {rng.randint(10**11, 10**12 - 1)}"], MARGIN + 30)
+    columns = [("Date", 60), ("Narration", 170), ("Ref No", 75), ("Debit", 65), ("Credit", 65), ("Balance", 60)]
+    top, row_height = MARGIN + 70, 18
+    balance = rng.uniform(10000, 500000)
+    table = [[name for name, _ in columns]]
+    for _ in range(rows):
+        amount = round(rng.uniform(100, 25000), 2)
+        debit = rng.random() < 0.6
+        balance += -amount if debit else amount
+        table.append([_date(rng), rng.choice(NARRATIONS), str(rng.randint(100000, 999999)),
+                      f"{amount:,.2f}" if debit else "", "" if debit else f"{amount:,.2f}", f"{balance:,.2f}"])
+    # Ruled grid, so the page is routed to table extraction
+    width = sum(w for _, w in columns)
+    for r in range(len(table) + 1):
+        page.draw_line((MARGIN, top + r * row_height), (MARGIN + width, top + r * row_height), width=0.5)
+    x = MARGIN
+    for _, w in columns + [(None, 0)]:
+        page.draw_line((x, top), (x, top + len(table) * row_height), width=0.5)
+        x += w
+    for r, row in enumerate(table):
+        x = MARGIN
+        for (_, w), cell in zip(columns, row):
+            page.insert_text((x + 3, top + r * row_height + 12), cell, fontsize=8,
+                             fontname="hebo" if r == 0 else "helv")
+            x += w
+
+GENERATORS = {"udyam": udyam_page, "devanagari": devanagari_page, "statement": statement_page}
+
+def _save(doc, path):
+    # Fixed metadata and no fresh /ID keep the output byte-identical per seed
+    doc.set_metadata({"producer": "bharatocr benchmark corpus", "creationDate": "", "modDate": ""})
+    doc.save(path, garbage=3, deflate=True, no_new_id=True)
+    doc.close()
+
+def make_document(kind, pages, rng):
+    doc = fitz.open()
+    for _ in range(pages):
+        GENERATORS[kind](doc.new_page(width=A4.width, height=A4.height), rng)
+    return doc
+
+def make_scanned_document(pages, dpi, rng):
+    """Digital pages of every kind rendered to grayscale images at dpi: no text layer, OCR only."""
+    kinds = sorted(GENERATORS)
+    source = fitz.open()
+    for i in range(pages):
+        GENERATORS[kinds[i % len(kinds)]](source.new_page(width=A4.width, height=A4.height), rng)
+    doc = fitz.open()
+    for page in source:
+        pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+        doc.new_page(width=page.rect.width, height=page.rect.height).insert_image(page.rect, pixmap=pix)
+    source.close()
+    return doc
+
+def generate_corpus(outdir, pages=DEFAULT_PAGES, scan_dpis=SCAN_DPIS, seed=0):
+    """Writes the corpus to outdir (existing files are overwritten); returns the PDF paths."""
+    os.makedirs(outdir, exist_ok=True)
+    paths = []
+    for kind in GENERATORS:
+        path = os.path.join(outdir, f"{kind}.pdf")
+        _save(make_document(kind, pages, random.Random(f"{seed}-{kind}")), path)
+        paths.append(path)
+    for dpi in scan_dpis:
+        path = os.path.join(outdir, f"scanned_{dpi}dpi.pdf")
+        _save(make_scanned_document(pages, dpi, random.Random(f"{seed}-scanned")), path)
+        paths.append(path)
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the synthetic benchmark corpus")
+    parser.add_argument("--outdir", type=str, default="bench_corpus")
+    parser.add_argument("--pages", type=int, default=DEFAULT_PAGES, help="Pages per document.")
+    parser.add_argument("--scan-dpis", type=str, default=",".join(map(str, SCAN_DPIS)),
+                        help="Comma-separated resolutions of the scanned documents.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    dpis = [int(d) for d in args.scan_dpis.split(",") if d]
+    for path in generate_corpus(args.outdir, args.pages, dpis, args.seed):
+        print(f"  {path} ({os.path.getsize(path) / 1e6:.2f} MB)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Load test for the local HTTP service (api/server.py).
+Submits a document many times with bounded client concurrency, polls each
+job to completion, and reports throughput, end-to-end latency percentiles
+and how many submissions were turned away with 429.
+Start the service first (python -m api.server), then run from the
+repository root: python benchmarks/load_test_api.py sample.pdf --jobs 50 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+async def request(host, port, method, path, body=b"", headers=None):
+    """One HTTP/1.1 request on a fresh connection; returns (status, headers, body)."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {host}", f"Content-Length: {len(body)}", "Connection: close"]
+        for key, value in (headers or {}).items():
+            lines.append(f"{key}: {value}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+        head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        status = int(head[0].split(" ")[1])
+        response_headers = {}
+        for line in head[1:]:
+            if ":" in line:
+                key, value = line.split(":", 1)
+                response_headers[key.strip().lower()] = value.strip()
+        data = await reader.readexactly(int(response_headers.get("content-length", 0)))
+        return status, response_headers, data
+    finally:
+        writer.close()
+
+async def run_job(args, name, data, stats):
+    start = time.perf_counter()
+    # Back off and resubmit while the service reports a full queue
+    while True:
+        status, headers, body = await request(args.host, args.port, "POST", f"/jobs?name={name}", data)
+        if status != 429:
+            break
+        stats["rejected"] += 1
+        await asyncio.sleep(float(headers.get("retry-after", 1)))
+    if status != 202:
+        stats["errors"] += 1
+        return
+    job_id = json.loads(body)["job_id"]
+    while True:
+        status, _, body = await request(args.host, args.port, "GET", f"/jobs/{job_id}/result")
+        if status == 200:
+            stats["pages"] += len(json.loads(body)["pages"])
+            break
+        if status != 202:
+            stats["errors"] += 1
+            return
+        await asyncio.sleep(args.poll_interval)
+    stats["latencies"].append(time.perf_counter() - start)
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+async def load_test(args):
+    with open(args.document, "rb") as f:
+        data = f.read()
+    name = os.path.basename(args.document)
+    stats = {"rejected": 0, "errors": 0, "pages": 0, "latencies": []}
+    limit = asyncio.Semaphore(args.concurrency)
+
+    async def one():
+        async with limit:
+            await run_job(args, name, data, stats)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(args.jobs)))
+    elapsed = time.perf_counter() - start
+
+    latencies = stats["latencies"]
+    print(f"Jobs: {len(latencies)} done, {stats['errors']} failed, {stats['rejected']} submissions rejected (429)")
+    print(f"Elapsed: {elapsed:.2f}s")
+    print(f"Throughput: {len(latencies) / elapsed:.2f} docs/sec, {stats['pages'] / elapsed:.2f} pages/sec")
+    print(f"Latency: p50 {percentile(latencies, 0.5):.3f}s, p95 {percentile(latencies, 0.95):.3f}s, max {max(latencies, default=0):.3f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP service load test")
+    parser.add_argument("document", type=str, help="Document to submit repeatedly.")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--jobs", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=16, help="Jobs in flight from the client side.")
+    parser.add_argument("--poll-interval", type=float, default=0.2)
+    args = parser.parse_args()
+    asyncio.run(load_test(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import glob
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from .processor import (
+    DEFAULT_WORKERS, SUPPORTED_EXTENSIONS, create_worker_pool, document_cache_key, feed_parse_state,
+    process_document,
+)
+from .parsing.registry import parser_registry
+
+# How many documents to keep queued per worker; bounds memory for huge batches
+IN_FLIGHT_PER_WORKER = 4
+
+def _is_supported(path):
+    return os.path.splitext(path.lower())[1] in SUPPORTED_EXTENSIONS
+
+def _expand_input(spec):
+    if os.path.isdir(spec):
+        for root, dirs, files in os.walk(spec):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                if _is_supported(path):
+                    yield path
+    elif glob.has_magic(spec):
+        for path in sorted(glob.glob(spec, recursive=True)):
+            if os.path.isfile(path) and _is_supported(path):
+                yield path
+    else:
+        yield spec
+
+def read_manifest(manifest_path):
+    """
+    Reads a manifest file: one document path (or directory/glob) per line.
+    Blank lines and lines starting with '#' are ignored.
+    """
+    with open(manifest_path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line
+
+def collect_inputs(inputs, manifest_path=None):
+    """
+    Expands files, directories (recursively) and glob patterns into a
+    de-duplicated list of document paths, in a stable order.
+    """
+    specs = list(inputs)
+    if manifest_path:
+        specs.extend(read_manifest(manifest_path))
+    seen = set()
+    paths = []
+    for spec in specs:
+        for path in _expand_input(spec):
+            if path not in seen:
+                seen.add(path)
+                paths.append(path)
+    return paths
+
+def _process_document_in_worker(file_path, cache=None):
+    parse_state = parser_registry.start_document()
+    try:
+        pages = process_document(file_path, cache=cache, parse_state=parse_state)
+    except Exception as e:
+        return file_path, None, f"{type(e).__name__}: {e}", None
+    return file_path, pages, None, parse_state.finish() if pages else None
+
+def _cached_document(pages):
+    """Document-level parse of pages served from the cache."""
+    parse_state = parser_registry.start_document()
+    feed_parse_state(parse_state, pages)
+    return parse_state.finish()
+
+def process_batch(file_paths, workers=DEFAULT_WORKERS, pool=None, cache=None):
+    """
+    Processes many documents through one long-lived pool of warm workers.
+    Yields (file_path, pages, error, document) tuples in completion order;
+    pages is None when the document failed or has an unsupported type, else
+    document is the document-level ParseResult.
+    With a ResultCache, lookups and stores happen in this process, so cached
+    documents never reach the pool and the cache counters stay accurate.
+    If a worker dies (e.g. OOM-killed on a large scan), the documents in
+    flight are reported as failed and the batch continues on a new pool.
+    """
+    if workers <= 1 and pool is None:
+        for file_path in file_paths:
+            yield _process_document_in_worker(file_path, cache)
+        return
+
+    own_pool = None
+    if pool is None:
+        pool = own_pool = create_worker_pool(workers)
+    max_in_flight = pool.workers * IN_FLIGHT_PER_WORKER
+    in_flight = {}  # future -> file_path
+    cache_keys = {}
+    broken = False
+
+    def finished(done):
+        nonlocal broken
+        for future in done:
+            file_path = in_flight.pop(future)
+            try:
+                file_path, pages, error, document = future.result()
+            except BrokenProcessPool as e:
+                broken = True
+                pages, error, document = None, f"{type(e).__name__}: {e}", None
+            if pages and file_path in cache_keys:
+                cache.put(cache_keys.pop(file_path), pages)
+            yield file_path, pages, error, document
+
+    try:
+        for file_path in file_paths:
+            if cache is not None and _is_supported(file_path):
+                key = document_cache_key(cache, file_path)
+                pages = cache.get(key)
+                if pages is not None:
+                    yield file_path, pages, None, _cached_document(pages)
+                    continue
+                cache_keys[file_path] = key
+            try:
+                if not broken:
+                    in_flight[pool.submit(_process_document_in_worker, file_path)] = file_path
+            except BrokenProcessPool:
+                broken = True
+            if broken:
+                # Every document still in the dead pool fails with it
+                done, _ = wait(list(in_flight))
+                yield from finished(done)
+                print(f"Worker pool broke; restarting it with {pool.workers} worker(s)")
+                if own_pool is not None:
+                    own_pool.shutdown(wait=False, cancel_futures=True)
+                pool = own_pool = create_worker_pool(pool.workers, pool.languages)
+                broken = False
+                in_flight[pool.submit(_process_document_in_worker, file_path)] = file_path
+            if len(in_flight) >= max_in_flight:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                yield from finished(done)
+        while in_flight:
+            done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            yield from finished(done)
+    finally:
+        for future in in_flight:
+            future.cancel()
+        if own_pool is not None:
+            own_pool.shutdown()
+
+class BatchStats:
+    """Throughput counters for a batch run."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.documents = 0
+        self.pages = 0
+        self.failed = 0
+
+    def record(self, pages):
+        if pages is None:
+            self.failed += 1
+        else:
+            self.documents += 1
+            self.pages += len(pages)
+
+    def summary(self):
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        return {
+            "documents": self.documents,
+            "pages": self.pages,
+            "failed": self.failed,
+            "seconds": round(elapsed, 3),
+            "docs_per_sec": round(self.documents / elapsed, 3),
+            "pages_per_sec": round(self.pages / elapsed, 3),
+        }
@@ -0,0 +1,155 @@
+import hashlib
+import os
+import tempfile
+from .output.json_output import dumps, loads
+
+# Bump whenever processing logic or the page dict format changes, so stale
+# cache entries are never served.
+PIPELINE_VERSION = "1"
+DEFAULT_CACHE_MAX_BYTES = 2 * 1024 ** 3
+# After exceeding the budget, evict down to this fraction of it
+EVICT_TO_FRACTION = 0.9
+CACHE_SUFFIX = ".jsonl"
+
+def file_digest(file_path, chunk_size=1024 * 1024):
+    """SHA-256 of a file's content."""
+    h = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+class CacheEntryWriter:
+    """
+    Streams pages into a temporary file next to the final entry; commit()
+    publishes it with an atomic rename, so readers never see partial entries.
+    """
+
+    def __init__(self, cache, key):
+        self.cache = cache
+        self.key = key
+        self.path = cache._entry_path(key)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd, self.tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+        self._file = os.fdopen(fd, 'wb')
+
+    def write(self, page_data):
+        self._file.write(dumps(page_data) + b"\n")
+
+    def commit(self):
+        self._file.close()
+        size = os.path.getsize(self.tmp_path)
+        os.replace(self.tmp_path, self.path)
+        self.cache._record_store(size)
+
+    def abort(self):
+        self._file.close()
+        try:
+            os.unlink(self.tmp_path)
+        except FileNotFoundError:
+            pass
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of process_document output.
+    Entries are keyed by file content hash plus a pipeline/config namespace,
+    stored one page per line, and evicted least-recently-used first once the
+    directory exceeds max_bytes. Several processes may share one directory.
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._approx_bytes = None
+
+    def key(self, content_digest, namespace=""):
+        return hashlib.sha256(f"{PIPELINE_VERSION}\0{namespace}\0{content_digest}".encode('utf-8')).hexdigest()
+
+    def key_for_file(self, file_path, namespace=""):
+        return self.key(file_digest(file_path), namespace)
+
+    def key_for_bytes(self, data, namespace=""):
+        return self.key(hashlib.sha256(data).hexdigest(), namespace)
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + CACHE_SUFFIX)
+
+    def get(self, key):
+        """Returns the cached list of page dicts, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                pages = [loads(line) for line in f]
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # mark as recently used for LRU eviction
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return pages
+
+    def writer(self, key):
+        return CacheEntryWriter(self, key)
+
+    def put(self, key, pages):
+        writer = self.writer(key)
+        try:
+            for page_data in pages:
+                writer.write(page_data)
+        except BaseException:
+            writer.abort()
+            raise
+        writer.commit()
+
+    def _entries(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(CACHE_SUFFIX):
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    yield st.st_mtime, st.st_size, path
+
+    def _record_store(self, size):
+        self.stores += 1
+        if self._approx_bytes is None:
+            self._approx_bytes = sum(size for _, size, _ in self._entries())
+        else:
+            self._approx_bytes += size
+        if self._approx_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Deletes least-recently-used entries until the cache fits its budget."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_TO_FRACTION
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass  # already evicted by another process
+            total -= size
+        self._approx_bytes = total
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
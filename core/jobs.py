@@ -0,0 +1,245 @@
+import os
+import socket
+import sqlite3
+import time
+from .output.json_output import dumps, loads
+
+# A running job whose worker has not reported progress for this long is
+# considered abandoned (crashed worker) and can be claimed again
+DEFAULT_LEASE_SECONDS = 10 * 60
+# Attempts before a job that keeps failing is marked failed for good
+MAX_ATTEMPTS = 3
+# Errors that another attempt cannot fix (unsupported file type, missing
+# file): the job fails at once instead of being retried
+PERMANENT_ERRORS = (ValueError, FileNotFoundError)
+BUSY_TIMEOUT_MS = 30000
+IDLE_POLL_SECONDS = 1.0
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    submitted_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    heartbeat_at REAL,
+    worker TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    pages_done INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    document TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+CREATE TABLE IF NOT EXISTS pages (
+    job_id INTEGER NOT NULL REFERENCES jobs (id) ON DELETE CASCADE,
+    page_number INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (job_id, page_number)
+);
+"""
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+class JobQueue:
+    """
+    Durable job queue in one SQLite database (WAL mode), shared by any
+    number of submitting and worker processes on the same machine.
+    Workers claim jobs atomically, store every page as it is finished and
+    resume an abandoned job from its first missing page.
+    Each process should open its own JobQueue.
+    """
+
+    def __init__(self, db_path, lease_seconds=DEFAULT_LEASE_SECONDS):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        # Autocommit mode: transactions are opened explicitly below
+        self.conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def submit(self, paths):
+        """Queues documents by path; returns their job ids."""
+        now = time.time()
+        ids = []
+        with self._transaction():
+            for path in paths:
+                cur = self.conn.execute("INSERT INTO jobs (path, submitted_at) VALUES (?, ?)", (os.path.abspath(path), now))
+                ids.append(cur.lastrowid)
+        return ids
+
+    def claim(self, worker=None):
+        """
+        Atomically takes the oldest queued job, or a running job whose lease
+        expired. Returns the job row (with pages_done to resume from), or None.
+        Abandoned jobs that already used MAX_ATTEMPTS are marked failed instead:
+        a document that keeps killing its worker never reaches fail().
+        """
+        worker = worker or default_worker_id()
+        now = time.time()
+        with self._transaction():
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? "
+                "WHERE status = ? AND heartbeat_at < ? AND attempts >= ?",
+                (FAILED, "worker lost (lease expired)", now, RUNNING, now - self.lease_seconds, MAX_ATTEMPTS),
+            )
+            row = self.conn.execute(
+                "SELECT id FROM jobs WHERE status = ? OR (status = ? AND heartbeat_at < ?) ORDER BY id LIMIT 1",
+                (QUEUED, RUNNING, now - self.lease_seconds),
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, worker = ?, attempts = attempts + 1, "
+                "started_at = COALESCE(started_at, ?), heartbeat_at = ? WHERE id = ?",
+                (RUNNING, worker, now, now, row["id"]),
+            )
+            return self._job(row["id"])
+
+    def record_page(self, job_id, page_data):
+        """Stores one finished page and extends the job's lease."""
+        data = dumps(page_data).decode('utf-8')
+        with self._transaction():
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (job_id, page_number, data) VALUES (?, ?, ?)",
+                (job_id, page_data["page_number"], data),
+            )
+            self.conn.execute(
+                "UPDATE jobs SET pages_done = MAX(pages_done, ?), heartbeat_at = ? WHERE id = ?",
+                (page_data["page_number"], time.time(), job_id),
+            )
+
+    def complete(self, job_id, document=None):
+        with self._transaction():
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, error = NULL, document = ? WHERE id = ?",
+                (DONE, time.time(), dumps(document).decode('utf-8'), job_id),
+            )
+
+    def fail(self, job_id, error, retry=True):
+        """
+        Records an error; the job is queued again until it ran out of
+        attempts, or fails for good right away when retry is False.
+        """
+        with self._transaction():
+            row = self.conn.execute("SELECT attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            status = FAILED if not retry or row is None or row["attempts"] >= MAX_ATTEMPTS else QUEUED
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (status, error, time.time() if status == FAILED else None, job_id),
+            )
+        return status
+
+    def retry_failed(self):
+        """Queues every failed job again, keeping its finished pages."""
+        with self._transaction():
+            cur = self.conn.execute("UPDATE jobs SET status = ?, attempts = 0, finished_at = NULL WHERE status = ?", (QUEUED, FAILED))
+        return cur.rowcount
+
+    def job(self, job_id):
+        return self._job(job_id)
+
+    def jobs(self, status=None):
+        if status is None:
+            rows = self.conn.execute("SELECT * FROM jobs ORDER BY id").fetchall()
+        else:
+            rows = self.conn.execute("SELECT * FROM jobs WHERE status = ? ORDER BY id", (status,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def pages(self, job_id):
+        """The stored pages of a job, in page order."""
+        rows = self.conn.execute("SELECT data FROM pages WHERE job_id = ? ORDER BY page_number", (job_id,))
+        return [loads(row["data"]) for row in rows]
+
+    def document(self, job_id):
+        row = self.conn.execute("SELECT document FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return loads(row["document"]) if row and row["document"] else None
+
+    def counts(self):
+        rows = self.conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status")
+        return {row["status"]: row["n"] for row in rows}
+
+    def _job(self, job_id):
+        row = self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def _transaction(self):
+        return _Transaction(self.conn)
+
+class _Transaction:
+    # BEGIN IMMEDIATE takes the write lock up front, so a claim's SELECT and
+    # UPDATE cannot interleave with another worker's claim
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+def run_job(queue, job):
+    """
+    Processes one claimed job, storing pages as they finish. A resumed job
+    starts after its last stored page; the stored pages are only replayed
+    into the document-level parse, not processed again.
+    """
+    # Imported here so the queue itself can be used without the OCR stack
+    from .processor import feed_parse_state, process_document_iter
+    from .parsing.registry import parser_registry
+
+    if not os.path.isfile(job["path"]):
+        raise FileNotFoundError(f"no such file: '{job['path']}'")
+    parse_state = parser_registry.start_document()
+    start_page = job["pages_done"]
+    if start_page:
+        print(f"Resuming job {job['id']} at page {start_page + 1}")
+        feed_parse_state(parse_state, queue.pages(job["id"])[:start_page])
+    for page_data in process_document_iter(job["path"], parse_state=parse_state, start_page=start_page):
+        queue.record_page(job["id"], page_data)
+    result = parse_state.finish()
+    queue.complete(job["id"], {
+        "document_type": result.doc_type,
+        "parsed_fields": result.fields,
+        "parsed_field_boxes": result.field_boxes,
+    })
+
+def run_worker(db_path, worker=None, exit_when_idle=False, lease_seconds=DEFAULT_LEASE_SECONDS):
+    """Worker loop: claims and processes jobs until the queue is empty (exit_when_idle) or forever."""
+    from .ocr.engine import ocr_engine_manager
+    from .processor import DEFAULT_OCR_LANGUAGES
+
+    queue = JobQueue(db_path, lease_seconds=lease_seconds)
+    worker = worker or default_worker_id()
+    ocr_engine_manager.preload(DEFAULT_OCR_LANGUAGES)
+    processed = 0
+    try:
+        while True:
+            job = queue.claim(worker)
+            if job is None:
+                if exit_when_idle:
+                    break
+                time.sleep(IDLE_POLL_SECONDS)
+                continue
+            print(f"[{worker}] Job {job['id']}: {job['path']}")
+            try:
+                run_job(queue, job)
+                processed += 1
+            except Exception as e:
+                status = queue.fail(job["id"], f"{type(e).__name__}: {e}", retry=not isinstance(e, PERMANENT_ERRORS))
+                print(f"[{worker}] Job {job['id']} failed ({status}): {e}")
+    finally:
+        queue.close()
+    return processed
@@ -0,0 +1,63 @@
+import re
+from functools import lru_cache
+from .detect import detect_language
+
+# The Indic blocks are contiguous 128-codepoint ranges starting at U+0900,
+# so the script of a character is a shift away: (ord(c) - 0x0900) >> 7.
+INDIC_BLOCK_START = 0x0900
+INDIC_SCRIPT_LANGUAGES = [
+    'hi',  # Devanagari
+    'bn',  # Bengali
+    'pa',  # Gurmukhi
+    'gu',  # Gujarati
+    'or',  # Oriya
+    'ta',  # Tamil
+    'te',  # Telugu
+    'kn',  # Kannada
+    'ml',  # Malayalam
+    'si',  # Sinhala
+]
+ARABIC_SCRIPT_LANGUAGE = 'ur'
+# Marker for tokens whose script does not identify the language
+LATIN = 'latin'
+
+_SCRIPT_CHAR = re.compile(r"[\u0600-\u06FF\u0900-\u0DFF]")
+_LETTER = re.compile(r"[^\W\d_]")
+
+@lru_cache(maxsize=4096)
+def _detect_latin_language(text):
+    return detect_language(text)
+
+def detect_script(token):
+    """
+    Classifies a single token by Unicode script.
+    Returns a language code for Indic/Arabic scripts, LATIN for other
+    alphabetic text, or None when the token has no letters.
+    """
+    m = _SCRIPT_CHAR.search(token)
+    if m:
+        code = ord(m.group())
+        if code < INDIC_BLOCK_START:
+            return ARABIC_SCRIPT_LANGUAGE
+        return INDIC_SCRIPT_LANGUAGES[(code - INDIC_BLOCK_START) >> 7]
+    if _LETTER.search(token):
+        return LATIN
+    return None
+
+def classify_tokens(tokens, groups=None):
+    """
+    Assigns a language code to every token in one call.
+    Non-Latin scripts are decided from Unicode ranges alone. Latin-script
+    tokens are resolved with langdetect once per group (e.g. per line),
+    using the joined Latin text of that group; groups defaults to a single
+    group for all tokens (page level).
+    """
+    languages = [detect_script(t) for t in tokens]
+    if groups is None:
+        groups = [0] * len(languages)
+    latin_text = {}
+    for token, lang, group in zip(tokens, languages, groups):
+        if lang == LATIN:
+            latin_text.setdefault(group, []).append(token)
+    resolved = {group: _detect_latin_language(" ".join(words)) for group, words in latin_text.items()}
+    return [resolved[g] if lang == LATIN else lang for lang, g in zip(languages, groups)]
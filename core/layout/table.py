@@ -0,0 +1,135 @@
+from collections.abc import Mapping
+import numpy as np
+
+# Decimal places kept when blocks are exposed as dicts; the float32 columns
+# would otherwise print as e.g. 72.0999984741211.
+COORD_DECIMALS = 2
+CONFIDENCE_DECIMALS = 4
+BLOCK_KEYS = ("bbox", "text", "language", "confidence")
+
+class LayoutBlockView(Mapping):
+    """Read-only dict view of one row of a LayoutTable; values are built on access."""
+
+    __slots__ = ("_table", "_idx")
+
+    def __init__(self, table, idx):
+        self._table = table
+        self._idx = idx
+
+    def __getitem__(self, key):
+        table, idx = self._table, self._idx
+        if key == "text":
+            return table.texts[idx]
+        if key == "bbox":
+            return np.round(table.bboxes[idx].astype(np.float64), COORD_DECIMALS).tolist()
+        if key == "language":
+            return table.languages[table.language_ids[idx]]
+        if key == "confidence":
+            return round(float(table.confidences[idx]), CONFIDENCE_DECIMALS)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(BLOCK_KEYS)
+
+    def __len__(self):
+        return len(BLOCK_KEYS)
+
+    def copy(self):
+        return dict(self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+class LayoutTable:
+    """
+    Struct-of-arrays page layout: one row per word/line block.
+      bboxes: float32 (N, 4) [x0, y0, x1, y1] boxes or (N, 4, 2) quads
+      texts: list of N strings
+      confidences: float32 (N,)
+      language_ids: small ints indexing the interned `languages` codes
+      directions: optional float32 (N, 2) text direction vectors
+    Indexing and iteration yield dict-like views with the old block keys, so
+    code written for lists of block dicts keeps working.
+    """
+
+    __slots__ = ("bboxes", "texts", "confidences", "language_ids", "languages", "directions")
+
+    def __init__(self, bboxes, texts, confidences, language_ids, languages, directions=None):
+        self.bboxes = bboxes
+        self.texts = texts
+        self.confidences = confidences
+        self.language_ids = language_ids
+        self.languages = languages
+        self.directions = directions
+
+    @classmethod
+    def from_columns(cls, bboxes, texts, languages, confidences, directions=None):
+        """Builds a table from per-block columns; language codes are interned."""
+        vocab = {}
+        ids = [vocab.setdefault(lang, len(vocab)) for lang in languages]
+        bboxes = np.asarray(bboxes, dtype=np.float32)
+        if bboxes.size == 0:
+            bboxes = bboxes.reshape(0, 4)
+        if directions is not None:
+            directions = np.asarray(directions, dtype=np.float32).reshape(-1, 2)
+        return cls(
+            bboxes=bboxes,
+            texts=list(texts),
+            confidences=np.asarray(confidences, dtype=np.float32).reshape(-1),
+            language_ids=np.asarray(ids, dtype=np.uint8 if len(vocab) <= 256 else np.uint16),
+            languages=list(vocab),
+            directions=directions,
+        )
+
+    @classmethod
+    def from_dicts(cls, blocks):
+        return cls.from_columns(
+            [b["bbox"] for b in blocks],
+            [b["text"] for b in blocks],
+            [b["language"] for b in blocks],
+            [b["confidence"] for b in blocks],
+        )
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += len(self.texts)
+        if not 0 <= idx < len(self.texts):
+            raise IndexError("layout index out of range")
+        return LayoutBlockView(self, idx)
+
+    def __iter__(self):
+        for idx in range(len(self.texts)):
+            yield LayoutBlockView(self, idx)
+
+    def block_languages(self):
+        """Language code of every block."""
+        return [self.languages[i] for i in self.language_ids.tolist()]
+
+    def with_texts(self, texts):
+        """Same table with replaced texts; the numeric columns are shared, not copied."""
+        return LayoutTable(self.bboxes, list(texts), self.confidences, self.language_ids, self.languages, self.directions)
+
+    def take(self, indices):
+        """New table with the given rows, in the given order."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return LayoutTable(
+            self.bboxes[indices],
+            [self.texts[i] for i in indices.tolist()],
+            self.confidences[indices],
+            self.language_ids[indices],
+            self.languages,
+            None if self.directions is None else self.directions[indices],
+        )
+
+    def to_dicts(self):
+        """Materializes the rows as plain block dicts (e.g. for JSON output)."""
+        # Column-wise: one rounding and one tolist per column, same values as the views
+        bboxes = np.round(self.bboxes.astype(np.float64), COORD_DECIMALS).tolist()
+        confidences = [round(c, CONFIDENCE_DECIMALS) for c in self.confidences.astype(np.float64).tolist()]
+        return [
+            {"bbox": bbox, "text": text, "language": language, "confidence": confidence}
+            for bbox, text, language, confidence in zip(bboxes, self.texts, self.block_languages(), confidences)
+        ]
@@ -0,0 +1,77 @@
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+
+DEFAULT_OCR_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Rough per-block overhead of a cached result (box lists, tuple, floats)
+BLOCK_OVERHEAD_BYTES = 400
+
+def image_key(image, lang):
+    """Hash of a rendered page raster (pixels, shape, dtype) and the OCR language."""
+    image = np.ascontiguousarray(image)
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{lang}:{image.shape}:{image.dtype}".encode('utf-8'))
+    h.update(image.data)
+    return h.hexdigest()
+
+def _estimate_size(result):
+    return sum(BLOCK_OVERHEAD_BYTES + len(block[1][0]) for block in result) + BLOCK_OVERHEAD_BYTES
+
+class OcrResultCache:
+    """
+    In-memory LRU cache of raw OCR output keyed by page raster hash, so
+    identical pages (standard T&C pages, bank cover sheets) are OCR'd once
+    per process. Bounded by an estimated byte budget, independent of the
+    document-level result cache.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_OCR_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (result, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, result):
+        size = _estimate_size(result)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (result, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
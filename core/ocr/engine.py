@@ -1,29 +1,172 @@
-from paddleocr import PaddleOCR
+import copy
 import logging
+import threading
+import numpy as np
+from .cache import OcrResultCache, image_key
 
 # Reduce paddleocr logging noise
 logging.getLogger('ppocr').setLevel(logging.ERROR)
 
+# Text-line crops per recognizer forward pass; batched OCR pools the crops of
+# several pages, so larger batches than PaddleOCR's default (6) pay off.
+REC_BATCH_SIZE = 32
+
 class OcrEngineManager:
-    def __init__(self, supported_languages=None):
+    def __init__(self, supported_languages=None, result_cache=None, engine_factory=None):
         # List of supported languages (add more as needed)
         if supported_languages is None:
             supported_languages = ['en', 'hi']
         self.supported_languages = supported_languages
         self.engines = {}
+        # Raw OCR output memoized by page raster; set to None to disable
+        self.result_cache = OcrResultCache() if result_cache is None else result_cache
+        # Guards engine creation so concurrent first requests build one engine
+        self._lock = threading.Lock()
+        # factory(lang) -> engine with PaddleOCR's ocr(image, cls=True); None means PaddleOCR
+        self.engine_factory = engine_factory
+
+    def set_engine_factory(self, factory):
+        """
+        Switches the OCR backend, e.g. to a fake engine for benchmarks that
+        must run without model files. Engines created so far and cached
+        results are dropped; None restores PaddleOCR.
+        """
+        with self._lock:
+            self.engine_factory = factory
+            self.engines = {}
+            if self.result_cache is not None:
+                self.result_cache.clear()
+
+    def _create_engine(self, lang):
+        if self.engine_factory is not None:
+            return self.engine_factory(lang)
+        # Imported here so that runs which never OCR (e.g. digital-only PDFs)
+        # never pay for importing paddleocr/paddle.
+        from paddleocr import PaddleOCR
+        print(f"Initializing PaddleOCR for language: {lang}")
+        return PaddleOCR(use_angle_cls=True, lang=lang, use_gpu=False, rec_batch_num=REC_BATCH_SIZE)
 
     def get_engine(self, lang):
         # Fallback to English if unsupported
         if lang not in self.supported_languages:
             lang = 'en'
-        if lang not in self.engines:
-            print(f"Initializing PaddleOCR for language: {lang}")
-            self.engines[lang] = PaddleOCR(use_angle_cls=True, lang=lang, use_gpu=False)
-        return self.engines[lang]
+        engine = self.engines.get(lang)
+        if engine is None:
+            with self._lock:
+                engine = self.engines.get(lang)
+                if engine is None:
+                    engine = self._create_engine(lang)
+                    self.engines[lang] = engine
+        return engine
+
+    def is_loaded(self, lang):
+        return lang in self.engines
+
+    def preload(self, languages=None, warm_up=True):
+        """
+        Creates the engines for the given languages (default: all supported)
+        ahead of the first request. With warm_up, also runs one tiny inference
+        per engine so lazy model initialization happens now, not on a user's page.
+        """
+        if languages is None:
+            languages = self.supported_languages
+        blank = np.full((32, 128, 3), 255, dtype=np.uint8)
+        for lang in languages:
+            engine = self.get_engine(lang)
+            if warm_up:
+                engine.ocr(blank, cls=True)
+        return self
+
+    def _cache_key(self, image, lang):
+        if self.result_cache is None or not isinstance(image, np.ndarray):
+            return None
+        return image_key(image, lang)
 
     def extract_text_from_image(self, image, lang='en'):
+        key = self._cache_key(image, lang)
+        if key is not None:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                return cached
+        result = self._run_ocr(image, lang)
+        if key is not None:
+            self.result_cache.put(key, result)
+        return result
+
+    def _run_ocr(self, image, lang):
         engine = self.get_engine(lang)
         result = engine.ocr(image, cls=True)
         return result[0] if result and result[0] else []
 
-ocr_engine_manager = OcrEngineManager() 
\ No newline at end of file
+    def extract_text_from_images(self, images, lang='en'):
+        """
+        OCRs several images in one call. Text detection runs per image, then the
+        text-line crops of all images are angle-classified and recognized
+        together in large batches. Returns one result per image, in input
+        order, in the same format as extract_text_from_image.
+        Images already in the result cache are not OCR'd again.
+        """
+        results = [None] * len(images)
+        keys = [self._cache_key(image, lang) for image in images]
+        todo = []
+        first_with_key = {}  # identical images within the batch are OCR'd once
+        for idx, key in enumerate(keys):
+            if key is None:
+                todo.append(idx)
+            elif key not in first_with_key:
+                first_with_key[key] = idx
+                results[idx] = self.result_cache.get(key)
+                if results[idx] is None:
+                    todo.append(idx)
+
+        engine = self.get_engine(lang) if todo else None
+        if engine is not None and not hasattr(engine, "text_recognizer"):
+            # Backend without PaddleOCR's staged detector/recognizer API
+            for idx in todo:
+                results[idx] = self._run_ocr(images[idx], lang)
+        elif engine is not None:
+            self._recognize_batch(engine, images, todo, results)
+
+        for idx in todo:
+            if keys[idx] is not None:
+                self.result_cache.put(keys[idx], results[idx])
+        for idx, key in enumerate(keys):
+            if results[idx] is None:
+                results[idx] = results[first_with_key[key]]
+        return results
+
+    def _recognize_batch(self, engine, images, todo, results):
+        # Importable once paddleocr is loaded (it puts its tools/ on sys.path)
+        from tools.infer.predict_system import sorted_boxes
+        from tools.infer.utility import get_rotate_crop_image
+
+        crops, owners, boxes = [], [], []
+        for idx in todo:
+            results[idx] = []
+            image = _as_bgr(images[idx])
+            dt_boxes, _ = engine.text_detector(image)
+            if dt_boxes is None or len(dt_boxes) == 0:
+                continue
+            for box in sorted_boxes(dt_boxes):
+                crops.append(get_rotate_crop_image(image, copy.deepcopy(box)))
+                owners.append(idx)
+                boxes.append(box)
+
+        if crops:
+            if engine.use_angle_cls:
+                crops, _, _ = engine.text_classifier(crops)
+            rec_res, _ = engine.text_recognizer(crops)
+            for idx, box, (text, score) in zip(owners, boxes, rec_res):
+                if score >= engine.drop_score:
+                    results[idx].append([box.tolist(), (text, score)])
+
+def _as_bgr(image):
+    """Brings an image path, grayscale or RGB array to the 3-channel input the detector expects."""
+    if isinstance(image, str):
+        import cv2  # installed with paddleocr
+        return cv2.imread(image)
+    if image.ndim == 2:
+        return np.repeat(image[:, :, np.newaxis], 3, axis=2)
+    return image
+
+ocr_engine_manager = OcrEngineManager()
@@ -0,0 +1,42 @@
+import io
+import zipfile
+from .csv_output import kv_csv_bytes, table_csv_bytes
+from .json_output import dumps
+
+def page_file_names(base, page_data):
+    """Download/archive names for one page's outputs, as main.py names its files."""
+    prefix = f"{base}_page{page_data['page_number']}"
+    return {
+        "json": f"{prefix}.json",
+        "csv": f"{prefix}.csv",
+        "tables": [f"{prefix}_table{idx}.csv" for idx in range(1, len(page_data.get("tables") or []) + 1)],
+    }
+
+def iter_document_files(base, pages, document=None, pretty=True):
+    """
+    Yields (file name, bytes) for every output of a document: per page the
+    JSON, the parsed-fields CSV and one CSV per table, plus the whole
+    document as JSONL and, when given, its document-level fields.
+    Each payload is serialized only when the iterator reaches it.
+    """
+    for page_data in pages:
+        names = page_file_names(base, page_data)
+        yield names["json"], dumps(page_data, pretty=pretty)
+        yield names["csv"], kv_csv_bytes(page_data.get("parsed_fields", {}))
+        for name, table in zip(names["tables"], page_data.get("tables") or []):
+            yield name, table_csv_bytes(table)
+    yield f"{base}.jsonl", b"".join(dumps(page_data) + b"\n" for page_data in pages)
+    if document is not None:
+        yield f"{base}_document.json", dumps(document, pretty=pretty)
+
+def zip_files(files):
+    """An in-memory ZIP archive of (file name, bytes) pairs, written entry by entry."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in files:
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+def document_zip_bytes(base, pages, document=None, pretty=True):
+    """All outputs of a document (see iter_document_files) as one ZIP archive."""
+    return zip_files(iter_document_files(base, pages, document, pretty))
@@ -0,0 +1,222 @@
+import os
+import time
+import numpy as np
+from ..layout.table import LayoutTable
+
+# Optional dependency: only needed for the parquet/arrow output formats
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+COLUMNAR_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+# Rows buffered per table before a row group (Parquet) or record batch
+# (Arrow IPC) is written; bounds the exporter's memory
+ROW_GROUP_ROWS = 256 * 1024
+# A new part file is started once the current one holds this many rows
+MAX_FILE_ROWS = 16 * 1024 * 1024
+PARQUET_COMPRESSION = "zstd"
+
+def _schemas():
+    box = [("x0", pa.float32()), ("y0", pa.float32()), ("x1", pa.float32()), ("y1", pa.float32())]
+    return {
+        "blocks": pa.schema([
+            ("doc_id", pa.string()), ("page_number", pa.int32()), ("block", pa.int32()),
+            *box,
+            ("text", pa.string()), ("language", pa.string()), ("confidence", pa.float32()),
+            ("watermark", pa.bool_()), ("low_confidence", pa.bool_()),
+        ]),
+        "pages": pa.schema([
+            ("doc_id", pa.string()), ("page_number", pa.int32()), ("type", pa.string()),
+            ("document_type", pa.string()), ("blocks", pa.int32()), ("watermark_blocks", pa.int32()),
+            ("redacted_items", pa.int32()), ("low_confidence_blocks", pa.int32()), ("tables", pa.int32()),
+        ]),
+        # page_number is null for document-level fields
+        "fields": pa.schema([
+            ("doc_id", pa.string()), ("page_number", pa.int32()), ("document_type", pa.string()),
+            ("field", pa.string()), ("value", pa.string()),
+            *box,
+        ]),
+    }
+
+def _layout_columns(layout):
+    """(boxes, texts, languages, confidences) of a LayoutTable or a list of block dicts."""
+    if isinstance(layout, LayoutTable):
+        return layout.bboxes, layout.texts, layout.block_languages(), layout.confidences
+    return (
+        np.asarray([b["bbox"] for b in layout], dtype=np.float32),
+        [b["text"] for b in layout],
+        [b["language"] for b in layout],
+        np.asarray([b["confidence"] for b in layout], dtype=np.float32),
+    )
+
+def _box_columns(boxes):
+    # Quads (N, 4, 2) are reduced to their axis-aligned bounds
+    if boxes.ndim == 3:
+        xs, ys = boxes[:, :, 0], boxes[:, :, 1]
+        return xs.min(1), ys.min(1), xs.max(1), ys.max(1)
+    return boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+
+class _PartWriter:
+    """
+    Appends record batches of one table to part files under a directory.
+    Batches are buffered up to ROW_GROUP_ROWS and written as one row group;
+    part files are written under a dot-prefixed temporary name (ignored by
+    dataset readers) and renamed into place when complete.
+    """
+
+    def __init__(self, directory, schema, fmt, run_id, row_group_rows, max_file_rows):
+        self.directory = directory
+        self.schema = schema
+        self.fmt = fmt
+        self.run_id = run_id
+        self.row_group_rows = row_group_rows
+        self.max_file_rows = max_file_rows
+        self.batches = []
+        self.buffered = 0
+        self.writer = None
+        self.file_rows = 0
+        self.part = 0
+        self.paths = []
+
+    def append(self, batch):
+        self.batches.append(batch)
+        self.buffered += batch.num_rows
+        if self.buffered >= self.row_group_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.buffered:
+            return
+        table = pa.Table.from_batches(self.batches, schema=self.schema).combine_chunks()
+        self.batches, self.buffered = [], 0
+        if self.writer is None:
+            self._open()
+        if self.fmt == "parquet":
+            self.writer.write_table(table, row_group_size=self.row_group_rows)
+        else:
+            self.writer.write_table(table, max_chunksize=self.row_group_rows)
+        self.file_rows += table.num_rows
+        if self.file_rows >= self.max_file_rows:
+            self._close_file()
+
+    def close(self):
+        self.flush()
+        self._close_file()
+
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"part-{self.run_id}-{self.part:04d}{COLUMNAR_FORMATS[self.fmt]}"
+        self.path = os.path.join(self.directory, name)
+        self.tmp_path = os.path.join(self.directory, f".{name}.tmp")
+        if self.fmt == "parquet":
+            self.writer = pq.ParquetWriter(self.tmp_path, self.schema, compression=PARQUET_COMPRESSION)
+        else:
+            self.writer = pa.ipc.new_file(self.tmp_path, self.schema)
+        self.file_rows = 0
+
+    def _close_file(self):
+        if self.writer is None:
+            return
+        self.writer.close()
+        os.replace(self.tmp_path, self.path)
+        self.paths.append(self.path)
+        self.writer = None
+        self.part += 1
+
+class ColumnarExporter:
+    """
+    Streams layout blocks, page summaries and parsed fields into three
+    columnar tables (blocks/, pages/, fields/) of Parquet or Arrow IPC part
+    files under root, one row per block/page/field with doc_id and
+    page_number columns. With partition, files go to a Hive-style
+    `<table>/partition=<value>/` directory, so a corpus can be appended to
+    run by run and scanned as one dataset (see open_dataset).
+    Memory stays bounded by row_group_rows buffered rows per table.
+    Requires pyarrow.
+    """
+
+    def __init__(self, root, fmt="parquet", partition=None, row_group_rows=ROW_GROUP_ROWS, max_file_rows=MAX_FILE_ROWS):
+        if pa is None:
+            raise ImportError("Parquet/Arrow export requires the 'pyarrow' package (pip install pyarrow)")
+        if fmt not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unknown columnar format '{fmt}'")
+        self.root = root
+        self.schemas = _schemas()
+        run_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        self.writers = {}
+        for table, schema in self.schemas.items():
+            directory = os.path.join(root, table)
+            if partition is not None:
+                directory = os.path.join(directory, f"partition={partition}")
+            self.writers[table] = _PartWriter(directory, schema, fmt, run_id, row_group_rows, max_file_rows)
+
+    def add_page(self, doc_id, page_data):
+        """Appends one page dict (as produced by process_document_iter or read back from JSON)."""
+        page_number = page_data["page_number"]
+        boxes, texts, languages, confidences = _layout_columns(page_data.get("layout", []))
+        n = len(texts)
+        if n:
+            x0, y0, x1, y1 = _box_columns(boxes)
+            watermark = np.zeros(n, dtype=bool)
+            watermark[page_data.get("watermark_blocks", [])] = True
+            low_confidence = np.zeros(n, dtype=bool)
+            low_confidence[page_data.get("low_confidence_blocks", [])] = True
+            self.writers["blocks"].append(pa.record_batch([
+                pa.array([doc_id] * n, pa.string()),
+                pa.array(np.full(n, page_number, dtype=np.int32)),
+                pa.array(np.arange(n, dtype=np.int32)),
+                pa.array(x0, pa.float32()), pa.array(y0, pa.float32()),
+                pa.array(x1, pa.float32()), pa.array(y1, pa.float32()),
+                pa.array(texts, pa.string()),
+                pa.array(languages, pa.string()),
+                pa.array(confidences, pa.float32()),
+                pa.array(watermark), pa.array(low_confidence),
+            ], schema=self.schemas["blocks"]))
+        self.writers["pages"].append(pa.record_batch([
+            [doc_id], [page_number], [page_data.get("type")], [page_data.get("document_type")], [n],
+            [len(page_data.get("watermark_blocks", []))], [len(page_data.get("redacted_items", []))],
+            [len(page_data.get("low_confidence_blocks", []))], [len(page_data.get("tables", []))],
+        ], schema=self.schemas["pages"]))
+        self._add_fields(doc_id, page_number, page_data.get("document_type"),
+                         page_data.get("parsed_fields", {}), page_data.get("parsed_field_boxes", {}))
+
+    def add_document_fields(self, doc_id, document_type, fields, field_boxes=None):
+        """Appends document-level fields (page_number is null; boxes may be {"page", "bbox"} dicts)."""
+        boxes = {k: v["bbox"] if isinstance(v, dict) else v for k, v in (field_boxes or {}).items()}
+        self._add_fields(doc_id, None, document_type, fields, boxes)
+
+    def _add_fields(self, doc_id, page_number, document_type, fields, field_boxes):
+        if not fields:
+            return
+        names = list(fields)
+        bboxes = [field_boxes.get(name) or [None] * 4 for name in names]
+        self.writers["fields"].append(pa.record_batch([
+            [doc_id] * len(names), [page_number] * len(names), [document_type] * len(names),
+            names, [str(fields[name]) for name in names],
+            *([bbox[i] for bbox in bboxes] for i in range(4)),
+        ], schema=self.schemas["fields"]))
+
+    def close(self):
+        """Writes buffered rows and publishes the part files; returns their paths."""
+        paths = []
+        for writer in self.writers.values():
+            writer.close()
+            paths.extend(writer.paths)
+        return paths
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def open_dataset(root, table="blocks", fmt="parquet"):
+    """
+    A pyarrow.dataset over every part file of one table under root (all runs
+    and partitions), for filtered, column-pruned scans, e.g.
+    open_dataset("output/columnar").to_table(columns=["text"], filter=ds.field("confidence") < 0.7)
+    """
+    import pyarrow.dataset as ds
+    return ds.dataset(os.path.join(root, table), format="ipc" if fmt == "arrow" else fmt, partitioning="hive")
@@ -1,14 +1,24 @@
 import csv
+import io
+
+def _write_kv_rows(f, data):
+    writer = csv.writer(f)
+    writer.writerow(['key', 'value'])
+    for k, v in data.items():
+        writer.writerow([k, v])
 
 def write_kv_csv(data, output_path):
     """
     Writes a dictionary of key-value pairs to a CSV file.
     """
     with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(['key', 'value'])
-        for k, v in data.items():
-            writer.writerow([k, v])
+        _write_kv_rows(f, data)
+
+def kv_csv_bytes(data):
+    """The key-value CSV of write_kv_csv as UTF-8 bytes, built in memory."""
+    f = io.StringIO(newline='')
+    _write_kv_rows(f, data)
+    return f.getvalue().encode('utf-8')
 
 def write_tables_csv(tables, output_path_prefix):
     """
@@ -19,6 +29,10 @@ def write_tables_csv(tables, output_path_prefix):
     for idx, table in enumerate(tables, 1):
         outpath = f"{output_path_prefix}{idx}.csv"
         with open(outpath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            for row in table:
-                writer.writerow(row) 
\ No newline at end of file
+            csv.writer(f).writerows(table)
+
+def table_csv_bytes(table):
+    """One table (list of rows) as CSV UTF-8 bytes, built in memory."""
+    f = io.StringIO(newline='')
+    csv.writer(f).writerows(table)
+    return f.getvalue().encode('utf-8')
@@ -1,8 +1,51 @@
 import json
+import numpy as np
+from ..layout.table import LayoutTable
+from .streams import open_output
 
-def write_json(data, output_path):
+# Optional fast path: orjson serializes NumPy arrays and scalars natively
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_default(obj):
+    """Serializes the non-JSON types found in page dicts."""
+    if isinstance(obj, LayoutTable):
+        return obj.to_dicts()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps(obj, pretty=False):
+    """
+    Serializes page data to UTF-8 JSON bytes: compact by default, indented
+    with pretty. Uses orjson when installed, which writes NumPy arrays and
+    scalars directly instead of going through Python lists; otherwise the
+    standard library with json_default.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=json_default, option=option)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=json_default).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=json_default).encode('utf-8')
+
+def loads(data):
+    """Parses JSON text or bytes, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_json(data, output_path, pretty=True, compression=None):
     """
     Writes structured data (including tables, layout, parsed fields) to a JSON file.
+    pretty=False writes compact JSON; compression is None, "gzip" or "zstd"
+    (by default inferred from a .gz/.zst suffix of output_path).
     """
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2) 
\ No newline at end of file
+    with open_output(output_path, compression) as f:
+        f.write(dumps(data, pretty=pretty))
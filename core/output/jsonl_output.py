@@ -0,0 +1,42 @@
+from .json_output import dumps
+from .streams import compression_for, open_output
+
+class JsonlWriter:
+    """
+    Writes one compact JSON object per line. Uncompressed files are flushed
+    after each record so pages are persisted as soon as they are produced;
+    compressed streams (gzip, zstd) are flushed on close by default, since
+    a flush per record ends a compression block and costs ratio.
+    """
+
+    def __init__(self, output_path, compression=None, flush=None):
+        self.output_path = output_path
+        self.count = 0
+        compression = compression or compression_for(output_path)
+        self.flush_each = compression is None if flush is None else flush
+        self._file = open_output(output_path, compression)
+
+    def write(self, record):
+        self._file.write(dumps(record) + b"\n")
+        if self.flush_each:
+            self._file.flush()
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def write_jsonl(records, output_path, compression=None):
+    """
+    Consumes an iterable of records (e.g. process_document_iter) and writes
+    each one as it arrives. Returns the number of records written.
+    """
+    with JsonlWriter(output_path, compression) as writer:
+        for record in records:
+            writer.write(record)
+    return writer.count
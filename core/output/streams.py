@@ -0,0 +1,40 @@
+import gzip
+import importlib.util
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+def compression_for(output_path):
+    """Compression implied by a file name suffix (.gz, .zst), or None."""
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if suffix and output_path.endswith(suffix):
+            return compression
+    return None
+
+def compressed_path(output_path, compression):
+    """output_path with the suffix of the given compression appended."""
+    return output_path + COMPRESSION_SUFFIXES[compression]
+
+def compression_available(compression):
+    """False when the compression needs an optional package that is not installed."""
+    return compression != "zstd" or importlib.util.find_spec("zstandard") is not None
+
+def open_output(output_path, compression=None):
+    """
+    Opens a binary output stream, compressing on the fly with gzip or zstd
+    (zstd requires the optional zstandard package). Without an explicit
+    compression it is inferred from the file name.
+    """
+    compression = compression or compression_for(output_path)
+    if compression is None:
+        return open(output_path, 'wb')
+    if compression == "gzip":
+        return gzip.open(output_path, 'wb', compresslevel=GZIP_LEVEL)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd output requires the 'zstandard' package (pip install zstandard)")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(open(output_path, 'wb'), closefd=True)
+    raise ValueError(f"Unknown compression '{compression}'")
@@ -0,0 +1,147 @@
+import re
+import numpy as np
+from ..layout.table import LayoutTable
+from ..postprocessing.text_index import JoinedText
+
+# Two blocks are on the same line if their vertical extents overlap by at
+# least this fraction of the smaller height
+SAME_LINE_OVERLAP = 0.5
+# A value below its label may start at most this many label heights lower
+MAX_VALUE_LINE_GAP = 1.5
+# Blocks examined after a label when looking for a value on the next line
+MAX_LOOKAHEAD_BLOCKS = 64
+
+def block_extents(layout):
+    """
+    Axis-aligned (x0, y0, x1, y1) lists for the blocks of a LayoutTable or a
+    list of block dicts, whose bboxes may be boxes or 4-point quads.
+    """
+    if isinstance(layout, LayoutTable):
+        boxes = layout.bboxes
+    else:
+        boxes = np.asarray([b["bbox"] for b in layout], dtype=np.float32)
+    if len(boxes) == 0:
+        return [], [], [], []
+    if boxes.ndim == 3:
+        xs, ys = boxes[:, :, 0], boxes[:, :, 1]
+        return xs.min(1).tolist(), ys.min(1).tolist(), xs.max(1).tolist(), ys.max(1).tolist()
+    return boxes[:, 0].tolist(), boxes[:, 1].tolist(), boxes[:, 2].tolist(), boxes[:, 3].tolist()
+
+def block_line_ids(layout):
+    """
+    Text line number of each block, in block order: a block continues the
+    previous block's line when their boxes overlap vertically (_same_line),
+    as the OCR boxes of one line do.
+    """
+    extents = block_extents(layout)
+    ids = []
+    line = 0
+    for i in range(len(extents[0])):
+        if i and not _same_line(extents, i - 1, i):
+            line += 1
+        ids.append(line)
+    return ids
+
+def layout_texts(layout):
+    if isinstance(layout, LayoutTable):
+        return layout.texts
+    return [b["text"] for b in layout]
+
+class LayoutKeyValueExtractor:
+    """
+    Finds "Label: value" fields from layout blocks.
+    All labels are found in one scan of the page's joined block text; each
+    value is then taken from the blocks right of its label on the same line,
+    or else from the nearest line below that overlaps the label horizontally,
+    and never runs into the next label. Values are validated with a
+    precompiled pattern per field (matched at the start of the value text).
+    """
+
+    def __init__(self, labels, value_patterns, flags=re.IGNORECASE):
+        # labels: [(field, label regex)]; value_patterns: {field: regex}
+        self.label_pattern = re.compile(
+            "|".join(f"(?P<{field}>{label})\\s*[:\\-]?\\s*" for field, label in labels), flags
+        )
+        self.value_patterns = {field: re.compile(p) for field, p in value_patterns.items()}
+
+    def extract(self, layout, carry=None):
+        """
+        Returns ({field: value}, {field: [x0, y0, x1, y1] of the value's blocks},
+        pending). pending names the field of a label that ends the page without
+        a value; passed back as carry for the next page, that value is read
+        from the first line of the next page.
+        """
+        texts = layout_texts(layout)
+        if not texts:
+            return {}, {}, carry
+        extents = block_extents(layout)
+        joined = JoinedText(texts)
+        labels = list(self.label_pattern.finditer(joined.text))
+        fields, boxes = {}, {}
+        first_label = labels[0].start() if labels else len(joined.text)
+        if carry is not None and first_label > 0:
+            self._take(fields, boxes, joined, extents, carry, 0, _line_end(joined, texts, extents, 0, first_label))
+        pending = None
+        for k, m in enumerate(labels):
+            field = m.lastgroup
+            if field in fields:
+                continue
+            next_label = labels[k + 1].start() if k + 1 < len(labels) else len(joined.text)
+            span = self._value_span(joined, texts, extents, m, next_label)
+            if span is not None:
+                self._take(fields, boxes, joined, extents, field, *span)
+            elif k + 1 == len(labels):
+                pending = field
+        return fields, boxes, pending
+
+    def _take(self, fields, boxes, joined, extents, field, start, end):
+        value = self.value_patterns[field].match(joined.text, start, end)
+        if value and value.group().strip():
+            fields[field] = value.group().strip()
+            boxes[field] = _union_box(extents, joined.blocks_in_span(value.start(), value.end()))
+
+    def _value_span(self, joined, texts, extents, label, next_label):
+        label_first = joined.block_at(label.start())
+        label_last = joined.block_at(max(label.end() - 1, label.start()))
+        # Same line: from the end of the label to the end of its line
+        end = _line_end(joined, texts, extents, label_last, next_label)
+        if end > label.end() and joined.text[label.end():end].strip():
+            return label.end(), end
+        # Next line: first block below the label that overlaps it horizontally
+        x0, y0, x1, y1 = extents
+        label_x0 = min(x0[label_first], x0[label_last])
+        label_x1 = max(x1[label_first], x1[label_last])
+        height = max(y1[label_last] - y0[label_last], 1e-6)
+        last = min(len(texts), label_last + 1 + MAX_LOOKAHEAD_BLOCKS)
+        for j in range(label_last + 1, last):
+            if joined.starts[j] >= next_label:
+                break
+            if y0[j] < y1[label_last] - height * (1 - SAME_LINE_OVERLAP):
+                continue
+            if y0[j] - y1[label_last] > height * MAX_VALUE_LINE_GAP:
+                break
+            if x0[j] < label_x1 and x1[j] > label_x0:
+                return joined.starts[j], _line_end(joined, texts, extents, j, next_label)
+        return None
+
+def _same_line(extents, i, j):
+    _, y0, _, y1 = extents
+    overlap = min(y1[i], y1[j]) - max(y0[i], y0[j])
+    return overlap > SAME_LINE_OVERLAP * min(y1[i] - y0[i], y1[j] - y0[j])
+
+def _line_end(joined, texts, extents, i, limit):
+    """Offset where the line containing block i ends (capped at limit)."""
+    j = i
+    while j + 1 < len(texts) and joined.starts[j + 1] < limit and _same_line(extents, i, j + 1):
+        j += 1
+    return min(joined.starts[j] + len(texts[j]), limit)
+
+def _union_box(extents, indices):
+    x0, y0, x1, y1 = extents
+    indices = list(indices)
+    return [
+        round(min(x0[i] for i in indices), 2),
+        round(min(y0[i] for i in indices), 2),
+        round(max(x1[i] for i in indices), 2),
+        round(max(y1[i] for i in indices), 2),
+    ]
@@ -0,0 +1,145 @@
+import re
+from collections import namedtuple
+from .udhyam_parser import UDYAM_ANCHORS, parse_udhyam_page
+
+# anchors: phrases (matched case-insensitively) whose presence on a page
+# makes the parser worth running; parse(text, layout, carry) returns
+# (fields, field_boxes, carry), layout being the page's blocks or None and
+# carry the parser's unfinished state handed on to the next page.
+ParserSpec = namedtuple("ParserSpec", ["name", "doc_type", "anchors", "parse"])
+
+ParseResult = namedtuple("ParseResult", ["doc_type", "fields", "field_boxes", "skipped"])
+
+UNKNOWN_DOC_TYPE = "Unknown"
+
+class ParserRegistry:
+    """
+    Document parsers plus a one-pass keyword classifier.
+    All anchors of all parsers are compiled into one alternation that is
+    scanned over the page text once; only parsers with an anchor hit run.
+    Like Aho-Corasick, every anchor occurrence is found, including ones that
+    overlap or are prefixes of longer anchors.
+    """
+
+    def __init__(self):
+        self.parsers = []
+        self._pattern = None
+        self._owners = {}
+        self._longest = 0
+
+    def register(self, name, doc_type, anchors, parse):
+        self.parsers.append(ParserSpec(name, doc_type, tuple(a.lower() for a in anchors), parse))
+        self._pattern = None
+        return parse
+
+    def _build(self):
+        anchors = {}
+        for spec in self.parsers:
+            for anchor in spec.anchors:
+                anchors.setdefault(anchor, set()).add(spec.name)
+        # Longest first, so a match is the longest anchor starting at that
+        # position; it also credits the parsers of every anchor it starts with.
+        ordered = sorted(anchors, key=len, reverse=True)
+        self._longest = len(ordered[0]) if ordered else 0
+        self._owners = {
+            anchor: frozenset().union(*(names for other, names in anchors.items() if anchor.startswith(other)))
+            for anchor in ordered
+        }
+        # Zero-width lookahead: a match is tried at every position, so
+        # overlapping anchors are not consumed by earlier matches.
+        self._pattern = re.compile("(?=(" + "|".join(re.escape(a) for a in ordered) + "))", re.IGNORECASE)
+
+    def classify(self, text, start=0):
+        """
+        Returns {parser name: anchor hit count} for the parsers whose anchors
+        occur in text. Anchors that end at or before start are not counted.
+        """
+        if self._pattern is None:
+            self._build()
+        hits = {}
+        if not self.parsers:
+            return hits
+        for m in self._pattern.finditer(text):
+            if m.end(1) <= start:
+                continue
+            for name in self._owners[m.group(1).lower()]:
+                hits[name] = hits.get(name, 0) + 1
+        return hits
+
+    def start_document(self):
+        """Returns a DocumentParseState to feed one document's pages to, in order."""
+        return DocumentParseState(self)
+
+    def parse(self, text, layout=None):
+        """
+        Classifies the text and runs only the parsers whose anchors appear,
+        most anchor hits first. The first parser returning fields decides the
+        document type. Returns a ParseResult.
+        """
+        return self.start_document().feed(text, layout)
+
+class DocumentParseState:
+    """
+    Incremental parse of one document from its page stream.
+    Each page is scanned once and never revisited: anchor hits accumulate
+    across pages, anchors split by a page break are found through the last
+    few characters carried over from the previous page, and a label that
+    ends a page is completed from the top of the next one. finish() returns
+    the document-level result.
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.pages = 0
+        self.hits = {}
+        self.fields = {}
+        self.field_boxes = {}
+        self._carry = {}
+        self._tail = ""
+
+    def feed(self, text, layout=None):
+        """Parses the next page; returns the page's ParseResult."""
+        registry = self.registry
+        self.pages += 1
+        window = self._tail + " " + text if self._tail else text
+        page_hits = registry.classify(window, start=len(window) - len(text))
+        self._tail = window[-(registry._longest - 1):] if registry._longest > 1 else ""
+        for name, count in page_hits.items():
+            self.hits[name] = self.hits.get(name, 0) + count
+
+        skipped = [spec.name for spec in registry.parsers if spec.name not in page_hits]
+        candidates = sorted(
+            (spec for spec in registry.parsers if spec.name in page_hits or spec.name in self._carry),
+            key=lambda spec: -page_hits.get(spec.name, 0),
+        )
+        result = None
+        for spec in candidates:
+            parsed, field_boxes, carry = spec.parse(text, layout, self._carry.pop(spec.name, None))
+            if carry is not None:
+                self._carry[spec.name] = carry
+            fields = self.fields.setdefault(spec.name, {})
+            boxes = self.field_boxes.setdefault(spec.name, {})
+            for field, value in parsed.items():
+                if field not in fields:
+                    fields[field] = value
+                    if field in field_boxes:
+                        boxes[field] = {"page": self.pages, "bbox": field_boxes[field]}
+            if parsed and result is None and spec.name in page_hits:
+                result = ParseResult(spec.doc_type, parsed, field_boxes, skipped)
+        return result or ParseResult(UNKNOWN_DOC_TYPE, {}, {}, skipped)
+
+    def finish(self):
+        """
+        Document-level ParseResult: the fields of the parser with the most
+        anchor hits over all pages that found any, each field taken from the
+        first page it appeared on. field_boxes map fields to
+        {"page": page number, "bbox": [x0, y0, x1, y1]}.
+        """
+        skipped = [spec.name for spec in self.registry.parsers if spec.name not in self.hits]
+        for spec in sorted(self.registry.parsers, key=lambda spec: -self.hits.get(spec.name, 0)):
+            if self.fields.get(spec.name):
+                return ParseResult(spec.doc_type, self.fields[spec.name], self.field_boxes[spec.name], skipped)
+        return ParseResult(UNKNOWN_DOC_TYPE, {}, {}, skipped)
+
+parser_registry = ParserRegistry()
+parser_registry.register("udyam", "Udyam_Certificate", UDYAM_ANCHORS, parse_udhyam_page)
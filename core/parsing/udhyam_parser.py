@@ -1,4 +1,5 @@
 import re
+from .layout_kv import LayoutKeyValueExtractor
 
 UDYAM_FIELDS = [
     ("udyam_number", r"Udyam Registration Number\s*[:\-]?\s*([A-Z0-9\-]+)", re.I),
@@ -8,6 +9,17 @@ UDYAM_FIELDS = [
     ("date_of_commencement", r"Date of Commencement\s*[:\-]?\s*([0-9\-/]+)", re.I),
 ]
 
+# Phrases that route a page to this parser: the field labels (every field
+# pattern starts with one) and the certificate's own wording
+UDYAM_ANCHORS = [
+    "Udyam Registration Number",
+    "Name of Enterprise",
+    "Name of Owner",
+    "Type of Organization",
+    "Date of Commencement",
+    "Udyam Registration Certificate",
+]
+
 def parse_udhyam(text):
     """
     Parses the text for Udyam Certificate fields.
@@ -18,4 +30,36 @@ def parse_udhyam(text):
         match = re.search(pattern, text, flags)
         if match:
             result[field] = match.group(1).strip()
-    return result 
\ No newline at end of file
+    return result 
+# Layout-based extraction: label anchors and value shapes, compiled once
+UDYAM_LABELS = [
+    ("udyam_number", r"Udyam Registration Number"),
+    ("enterprise_name", r"Name of Enterprise"),
+    ("owner_name", r"Name of Owner"),
+    ("type_of_organization", r"Type of Organization"),
+    ("date_of_commencement", r"Date of Commencement"),
+]
+UDYAM_VALUE_PATTERNS = {
+    "udyam_number": r"[A-Z0-9\-]+",
+    "enterprise_name": r"[A-Za-z0-9\s\.,&'-]+",
+    "owner_name": r"[A-Za-z0-9\s\.,&'-]+",
+    "type_of_organization": r"[A-Za-z\s]+",
+    "date_of_commencement": r"[0-9\-/]+",
+}
+_udyam_extractor = LayoutKeyValueExtractor(UDYAM_LABELS, UDYAM_VALUE_PATTERNS)
+
+def parse_udhyam_layout(layout, carry=None):
+    """
+    Extracts Udyam Certificate fields from layout blocks by label position:
+    one label scan per page, values taken from the adjacent blocks.
+    Returns (fields, field_boxes, carry) where field_boxes maps each field to
+    the [x0, y0, x1, y1] box of its value and carry names a label left
+    without a value at the end of the page.
+    """
+    return _udyam_extractor.extract(layout, carry)
+
+def parse_udhyam_page(text, layout=None, carry=None):
+    """Layout-based extraction when blocks are available, else the text regexes."""
+    if layout is not None and len(layout):
+        return parse_udhyam_layout(layout, carry)
+    return parse_udhyam(text), {}, None
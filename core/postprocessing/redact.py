@@ -1,4 +1,6 @@
 import re
+from .text_index import JoinedText
+from ..layout.table import LayoutTable
 
 REDACTION_PATTERNS = [
     ("PAN", re.compile(r"[A-Z]{5}[0-9]{4}[A-Z]")),
@@ -7,32 +9,97 @@ REDACTION_PATTERNS = [
     ("BANK_AC", re.compile(r"\b\d{9,18}\b")),
 ]
 
+# All patterns as one alternation with a named group per label, so each text
+# is scanned once. Where patterns overlap, the earlier label wins (e.g. a
+# 12-digit Aadhaar is not also reported as a bank account number).
+COMBINED_REDACTION_PATTERN = re.compile(
+    "|".join(f"(?P<{label}>{pattern.pattern})" for label, pattern in REDACTION_PATTERNS)
+)
+
 REDACTED_STR = "[REDACTED]"
+# Placed between text lines when a page's blocks are joined: it is neither
+# whitespace nor a word character, so no pattern can match across lines
+# (Python's \s matches "\n")
+LINE_SEP = "\x00"
+
+def find_sensitive_spans(text):
+    """
+    Scans the text once for sensitive data.
+    Returns a list of (type, start, end) tuples in text order.
+    """
+    return [(m.lastgroup, m.start(), m.end()) for m in COMBINED_REDACTION_PATTERN.finditer(text)]
 
 def redact_text(text):
     """
     Redacts sensitive data in the text.
     Returns redacted text and a list of (type, match) tuples.
     """
-    redacted = text
-    found = []
-    for label, pattern in REDACTION_PATTERNS:
-        for m in pattern.findall(text):
-            found.append((label, m))
-            redacted = redacted.replace(m, REDACTED_STR)
-    return redacted, found
+    spans = find_sensitive_spans(text)
+    if not spans:
+        return text, []
+    found = [(label, text[start:end]) for label, start, end in spans]
+    return _replace_ranges(text, [(start, end) for _, start, end in spans]), found
+
+def _replace_ranges(text, ranges):
+    parts = []
+    pos = 0
+    for start, end in ranges:
+        parts.append(text[pos:start])
+        parts.append(REDACTED_STR)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
 
-def redact_blocks(layout_blocks):
+def redact_texts(texts, line_ids=None):
     """
-    Redacts sensitive data in each block's text.
-    Returns new blocks and a list of redacted items.
+    Redacts sensitive data across a page's block texts.
+    The texts are joined and scanned once, so values split over several
+    words on one line ("1234" "5678" "9012") are caught; every text a match
+    touches has its part of the match replaced.
+    line_ids gives each block's text line (e.g. (block_no, line_no) of PDF
+    words); only blocks on the same line are joined with a space, so numbers
+    in separate lines or table rows never combine into one match (OCR
+    blocks get theirs from layout_kv.block_line_ids). Without line_ids each
+    block is its own line.
+    Returns a new list of texts (unchanged ones are the same objects) and a
+    list of (type, match) tuples.
     """
-    redacted_blocks = []
+    if line_ids is None:
+        joined = JoinedText(texts, sep=LINE_SEP)
+    else:
+        joined = JoinedText(texts, seps=[
+            " " if i and line_ids[i] == line_ids[i - 1] else LINE_SEP for i in range(len(texts))
+        ])
+    cuts = {}  # text index -> [(start, end)] within that text
     all_found = []
-    for block in layout_blocks:
-        redacted_text, found = redact_text(block["text"])
-        new_block = block.copy()
-        new_block["text"] = redacted_text
-        redacted_blocks.append(new_block)
-        all_found.extend(found)
-    return redacted_blocks, all_found 
\ No newline at end of file
+    for label, start, end in find_sensitive_spans(joined.text):
+        all_found.append((label, joined.text[start:end]))
+        for idx in joined.blocks_in_span(start, end):
+            block_start = joined.starts[idx]
+            cuts.setdefault(idx, []).append((max(start - block_start, 0), min(end - block_start, len(texts[idx]))))
+
+    redacted = list(texts)
+    for idx, ranges in cuts.items():
+        redacted[idx] = _replace_ranges(texts[idx], ranges)
+    return redacted, all_found
+
+def redact_blocks(layout_blocks, line_ids=None):
+    """
+    Redacts sensitive data across the blocks of a page (see redact_texts,
+    also for line_ids).
+    Accepts a LayoutTable, returning a table that shares its numeric columns,
+    or a list of block dicts, returning a list in which only changed blocks
+    are copied. Also returns the list of redacted items.
+    """
+    if isinstance(layout_blocks, LayoutTable):
+        texts, all_found = redact_texts(layout_blocks.texts, line_ids)
+        return layout_blocks.with_texts(texts), all_found
+
+    texts, all_found = redact_texts([block["text"] for block in layout_blocks], line_ids)
+    redacted_blocks = list(layout_blocks)
+    for idx, (block, text) in enumerate(zip(layout_blocks, texts)):
+        if text is not block["text"]:
+            new_block = block.copy()
+            new_block["text"] = text
+            redacted_blocks[idx] = new_block
+    return redacted_blocks, all_found
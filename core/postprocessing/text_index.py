@@ -0,0 +1,39 @@
+from array import array
+from bisect import bisect_right
+
+class JoinedText:
+    """
+    Block texts joined into one string, with a compact index of each block's
+    start offset, so a match found in the joined text can be mapped back to
+    the blocks it covers.
+    """
+
+    def __init__(self, texts, sep=" ", seps=None):
+        # seps optionally gives the separator placed before each text (the
+        # first entry is unused), e.g. to tell word and line boundaries apart
+        self.sep = sep
+        self.starts = array('q')
+        pos = 0
+        if seps is None:
+            for t in texts:
+                self.starts.append(pos)
+                pos += len(t) + len(sep)
+            self.text = sep.join(texts)
+            return
+        parts = []
+        for i, t in enumerate(texts):
+            if i:
+                parts.append(seps[i])
+                pos += len(seps[i])
+            self.starts.append(pos)
+            parts.append(t)
+            pos += len(t)
+        self.text = "".join(parts)
+
+    def block_at(self, offset):
+        """Index of the block containing offset (a separator maps to the block before it)."""
+        return bisect_right(self.starts, offset) - 1
+
+    def blocks_in_span(self, start, end):
+        """Indices of the blocks overlapped by the half-open span [start, end)."""
+        return range(self.block_at(start), self.block_at(end - 1) + 1)
@@ -1,31 +1,73 @@
-import math
+import re
+import numpy as np
+from .text_index import JoinedText
+from ..layout.table import LayoutTable
 
 WATERMARK_WORDS = ["draft", "copy", "sample", "specimen"]
 ANGLE_THRESHOLD_DEGREES = 10  # If angle deviates from 0/90 by more than this, flag as watermark
 
+# One case-insensitive scan finds every keyword, like a lowercase substring check
+WATERMARK_PATTERN = re.compile("|".join(re.escape(w) for w in WATERMARK_WORDS), re.IGNORECASE)
+
+def block_angles(bboxes=None, directions=None):
+    """
+    Text direction of each block in degrees, normalized to [0, 180).
+    directions: (N, 2) unit vectors along the text line (e.g. PyMuPDF line "dir").
+    bboxes: (N, 4, 2) quads (PaddleOCR, top edge from point 0 to point 1)
+    or (N, 4) axis-aligned [x0, y0, x1, y1] boxes, which carry no rotation.
+    """
+    if directions is not None:
+        d = np.asarray(directions, dtype=np.float64).reshape(-1, 2)
+        dx, dy = d[:, 0], d[:, 1]
+    else:
+        boxes = np.asarray(bboxes, dtype=np.float64)
+        if boxes.ndim != 3:
+            return np.zeros(len(boxes))
+        dx = boxes[:, 1, 0] - boxes[:, 0, 0]
+        dy = boxes[:, 1, 1] - boxes[:, 0, 1]
+    return np.abs(np.degrees(np.arctan2(dy, dx))) % 180
+
+def rotated_mask(bboxes=None, directions=None):
+    """Boolean mask of blocks whose angle is not close to 0, 90 or 180 degrees."""
+    angle = block_angles(bboxes, directions)
+    deviation = np.minimum(np.minimum(angle, np.abs(angle - 90)), 180 - angle)
+    return deviation > ANGLE_THRESHOLD_DEGREES
+
 def is_rotated(bbox):
-    # bbox: [x0, y0, x1, y1] (assume horizontal if y0==y1)
-    x0, y0, x1, y1 = bbox
-    dx = x1 - x0
-    dy = y1 - y0
-    angle = math.degrees(math.atan2(dy, dx))
-    # Normalize angle to [0, 180)
-    angle = abs(angle) % 180
-    # Check if angle is not close to 0 or 90
-    if min(abs(angle), abs(angle-90)) > ANGLE_THRESHOLD_DEGREES:
-        return True
-    return False
+    # bbox: 4-point quad [[x, y], ...] or axis-aligned [x0, y0, x1, y1]
+    return bool(rotated_mask([bbox])[0])
 
 def is_watermark_text(text):
-    t = text.lower()
-    return any(w in t for w in WATERMARK_WORDS)
+    return WATERMARK_PATTERN.search(text) is not None
+
+def watermark_text_mask(texts):
+    """Boolean mask of texts containing a watermark keyword, from one scan of the joined texts."""
+    mask = np.zeros(len(texts), dtype=bool)
+    joined = JoinedText(texts, sep="\n")
+    for m in WATERMARK_PATTERN.finditer(joined.text):
+        mask[joined.block_at(m.start())] = True
+    return mask
 
-def flag_watermark_blocks(layout_blocks):
+def flag_watermark_blocks(layout_blocks, directions=None):
     """
     Returns a list of indices of blocks flagged as watermark.
+    layout_blocks: a LayoutTable (its columns are used directly) or a list of block dicts.
+    directions: optional (N, 2) text direction vectors, used instead of the
+    bboxes to decide rotation (digital pages, whose word boxes are axis-aligned).
+    Defaults to the table's directions column.
     """
-    flagged = []
-    for i, block in enumerate(layout_blocks):
-        if is_rotated(block["bbox"]) or is_watermark_text(block["text"]):
-            flagged.append(i)
-    return flagged 
\ No newline at end of file
+    if not len(layout_blocks):
+        return []
+    if isinstance(layout_blocks, LayoutTable):
+        texts = layout_blocks.texts
+        bboxes = layout_blocks.bboxes
+        if directions is None:
+            directions = layout_blocks.directions
+    else:
+        texts = [block["text"] for block in layout_blocks]
+        bboxes = [block["bbox"] for block in layout_blocks]
+    if directions is not None:
+        rotated = rotated_mask(directions=directions)
+    else:
+        rotated = rotated_mask(bboxes)
+    return np.flatnonzero(rotated | watermark_text_mask(texts)).tolist()
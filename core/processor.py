@@ -1,65 +1,178 @@
+import io
+import json
 import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 import fitz  # PyMuPDF
 import numpy as np
 from PIL import Image
 from .ocr.engine import ocr_engine_manager
-from .language.detect import detect_language
-from .parsing.udhyam_parser import parse_udhyam
+from .language.script import classify_tokens
+from .layout.table import LayoutTable
+from .parsing.layout_kv import block_line_ids
+from .parsing.registry import parser_registry
 import pdfplumber
 from .postprocessing.watermark import flag_watermark_blocks
 from .postprocessing.redact import redact_blocks
+from .source import read_source
 
 # A threshold to decide if a PDF page is scanned.
 # If the text extracted from the text layer is less than this, we assume it's scanned.
 MIN_TEXT_LENGTH_FOR_DIGITAL = 100
 CONFIDENCE_THRESHOLD = 0.7
+# Rasterization of scanned pages for OCR
+MIN_RENDER_DPI = 150
+MAX_RENDER_DPI = 300
+# Text height (pixels) to aim for; PaddleOCR's recognizer works on 48px-high line crops
+TARGET_GLYPH_HEIGHT_PX = 32
+# Upper bound on rendered pixels per page (12 MP ~ A4 at 250 DPI), to cap memory
+MAX_RENDER_MEGAPIXELS = 12.0
+RENDER_GRAYSCALE = True
+# Vector drawing operators pdfplumber turns into table edges (lines, rects, quads, curves)
+TABLE_DRAWING_OPS = ("l", "re", "qu", "c")
+# Default size of the worker pool used to OCR scanned PDF pages in parallel
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 1) - 1)
+DEFAULT_OCR_LANGUAGES = ['en']
+# Consecutive scanned pages OCR'd together so line recognition runs in large batches
+OCR_BATCH_PAGES = 4
+# OCR batches queued per worker ahead of the page being yielded; bounds memory
+TASKS_AHEAD_PER_WORKER = 2
+IMAGE_EXTENSIONS = [".png", ".jpg", ".jpeg", ".tiff", ".bmp"]
+SUPPORTED_EXTENSIONS = [".pdf"] + IMAGE_EXTENSIONS
 
-def _convert_page_to_image(page, dpi=300):
-    """Converts a PDF page to a numpy array image."""
-    pix = page.get_pixmap(dpi=dpi)
-    image = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
-    if pix.n == 4: # RGBA
-        # Convert to RGB for OCR
-        image = image[..., :3]
-    return image
-
-def _extract_digital_pdf_layout(page):
-    # Extract word-level bounding boxes and text
-    words = page.get_text("words")  # list of (x0, y0, x1, y1, word, block_no, line_no, word_no)
-    layout_blocks = []
-    for w in words:
-        x0, y0, x1, y1, word = w[:5]
-        lang = detect_language(word)
-        layout_blocks.append({
-            "bbox": [x0, y0, x1, y1],
-            "text": word,
-            "language": lang,
-            "confidence": 1.0  # Digital PDFs have no confidence, so set to 1.0
-        })
-    return layout_blocks
-
-def _extract_ocr_layout_blocks(layout_blocks):
-    # Convert PaddleOCR output to a standard format
-    result = []
-    for block in layout_blocks:
-        bbox, (text, conf) = block
-        lang = detect_language(text)
-        result.append({
-            "bbox": bbox,
-            "text": text,
-            "language": lang,
-            "confidence": conf
-        })
-    return result
-
-def _parse_document_type(text):
-    # For now, always try Udyam parser
-    parsed = parse_udhyam(text)
-    if parsed:
-        doc_type = "Udyam_Certificate"
-    else:
-        doc_type = "Unknown"
-    return doc_type, parsed
+def _estimate_glyph_height(words):
+    """Median word box height (points) of whatever text layer the page has."""
+    heights = sorted(w[3] - w[1] for w in words if w[3] > w[1])
+    return heights[len(heights) // 2] if heights else None
+
+def _native_image_dpi(page):
+    """Effective resolution of the largest image drawn on the page, if any."""
+    best_area, best_dpi = 0, None
+    for info in page.get_image_info():
+        bbox = fitz.Rect(info["bbox"])
+        area = abs(bbox.width * bbox.height)
+        if area > best_area and info["width"] and info["height"]:
+            best_area = area
+            best_dpi = 72 * ((info["width"] * info["height"]) / area) ** 0.5
+    return best_dpi
+
+def _choose_render_dpi(page, words=None):
+    """
+    Picks the rendering DPI for OCR: the resolution of the embedded scan, so
+    no detail is lost and none is invented. Only pages without an image use
+    their text layer, rendered to bring text to roughly TARGET_GLYPH_HEIGHT_PX;
+    on a scan, the few words there are (a Bates number, a stamp) say nothing
+    about the scanned text. Clamped to [MIN_RENDER_DPI, MAX_RENDER_DPI] and
+    to MAX_RENDER_MEGAPIXELS.
+    """
+    dpi = _native_image_dpi(page)
+    if dpi is None:
+        glyph_height = _estimate_glyph_height(words) if words else None
+        dpi = TARGET_GLYPH_HEIGHT_PX * 72 / glyph_height if glyph_height else MAX_RENDER_DPI
+    dpi = min(max(dpi, MIN_RENDER_DPI), MAX_RENDER_DPI)
+    # Page size ceiling: width_px * height_px <= MAX_RENDER_MEGAPIXELS
+    rect = page.rect
+    max_dpi = 72 * (MAX_RENDER_MEGAPIXELS * 1e6 / (rect.width * rect.height)) ** 0.5
+    return int(min(dpi, max_dpi))
+
+def _convert_page_to_image(page, dpi=None, words=None):
+    """
+    Converts a PDF page to a numpy array image.
+    Renders without alpha, in grayscale when RENDER_GRAYSCALE is set (PaddleOCR
+    accepts 2-D grayscale arrays), so the array is contiguous and never copied.
+    """
+    if dpi is None:
+        dpi = _choose_render_dpi(page, words)
+    colorspace = fitz.csGRAY if RENDER_GRAYSCALE else fitz.csRGB
+    pix = page.get_pixmap(dpi=dpi, colorspace=colorspace, alpha=False)
+    image = np.frombuffer(pix.samples, dtype=np.uint8)
+    if pix.n == 1:
+        return image.reshape(pix.height, pix.width)
+    return image.reshape(pix.height, pix.width, pix.n)
+
+def _extract_page_words(page):
+    # Single text-layer parse per page: words carry the text, boxes and line ids.
+    # TEXTFLAGS_WORDS are get_text("words")'s own defaults, so the words are unchanged.
+    textpage = page.get_textpage(flags=fitz.TEXTFLAGS_WORDS)
+    words = page.get_text("words", textpage=textpage)  # list of (x0, y0, x1, y1, word, block_no, line_no, word_no)
+    return words, textpage
+
+def _word_directions(page, textpage, words):
+    """(N, 2) text direction vector of each word, taken from its PyMuPDF line."""
+    line_dirs = {}
+    for block in page.get_text("dict", textpage=textpage)["blocks"]:
+        for line_no, line in enumerate(block.get("lines", ())):
+            line_dirs[(block["number"], line_no)] = line["dir"]
+    return np.array([line_dirs.get((w[5], w[6]), (1.0, 0.0)) for w in words], dtype=np.float64).reshape(-1, 2)
+
+def _word_line_ids(words):
+    """(block_no, line_no) of each word: words sharing it are on one text line."""
+    return [(w[5], w[6]) for w in words]
+
+def _text_length(words):
+    """Length of the page text as ' '.join(words) would give it, without building it."""
+    return sum(len(w[4]) for w in words) + max(len(words) - 1, 0)
+
+def _page_may_have_tables(page):
+    """
+    Cheap pre-check for pdfplumber's table finder, which builds tables from
+    ruling lines, rectangles and curves: pages without any such vector
+    graphics cannot yield a table.
+    """
+    for path in page.get_cdrawings():
+        for item in path["items"]:
+            if item[0] in TABLE_DRAWING_OPS:
+                return True
+    return False
+
+def _extract_digital_pdf_layout(page, words=None, textpage=None):
+    # Extract word-level bounding boxes and text as a columnar LayoutTable
+    if words is None:
+        words, textpage = _extract_page_words(page)
+    texts = [w[4] for w in words]
+    # Script-based language per word; Latin words fall back to langdetect per line
+    languages = classify_tokens(texts, groups=_word_line_ids(words))
+    return LayoutTable.from_columns(
+        bboxes=[w[:4] for w in words],
+        texts=texts,
+        languages=languages,
+        confidences=np.ones(len(words)),  # Digital PDFs have no confidence, so set to 1.0
+        # Word boxes are axis-aligned; rotation comes from the line direction vectors
+        directions=_word_directions(page, textpage, words),
+    )
+
+def _extract_ocr_layout_blocks(layout_blocks, scale=None):
+    # Convert PaddleOCR output ([quad, (text, conf)] per line) to a LayoutTable;
+    # scale maps the quads from image pixels to other units (e.g. PDF points)
+    texts = [text for _, (text, _) in layout_blocks]
+    # Each OCR block is a text line, so Latin lines fall back to langdetect per block
+    languages = classify_tokens(texts, groups=range(len(layout_blocks)))
+    bboxes = [bbox for bbox, _ in layout_blocks]
+    if scale is not None and bboxes:
+        bboxes = np.asarray(bboxes, dtype=np.float64) * scale
+    return LayoutTable.from_columns(
+        bboxes=bboxes,
+        texts=texts,
+        languages=languages,
+        confidences=[conf for _, (_, conf) in layout_blocks],
+    )
+
+def _parse_document_type(text, layout=None, parse_state=None):
+    # Only parsers whose anchor phrases occur in the text are run; with a
+    # DocumentParseState the page also extends the document-level parse
+    if parse_state is not None:
+        return parse_state.feed(text, layout)
+    return parser_registry.parse(text, layout)
+
+def _parse_layout(page_data):
+    """The page's layout without watermark blocks, as used for the page text."""
+    layout = page_data["layout"]
+    keep = np.ones(len(layout), dtype=bool)
+    keep[page_data["watermark_blocks"]] = False
+    if isinstance(layout, LayoutTable):
+        return layout.take(np.flatnonzero(keep))
+    # Pages read back from the result cache hold plain block dicts
+    return [block for block, kept in zip(layout, keep.tolist()) if kept]
 
 def _extract_tables_from_pdfplumber(pdfplumber_page):
     tables = []
@@ -68,87 +181,257 @@ def _extract_tables_from_pdfplumber(pdfplumber_page):
         tables.append(table)
     return tables
 
-def _postprocess_layout(layout):
+def _postprocess_layout(layout, line_ids=None):
     # 1. Watermark filtering
-    watermark_idxs = set(flag_watermark_blocks(layout))
-    # 2. Redaction
-    redacted_layout, redacted_items = redact_blocks(layout)
+    watermark_idxs = flag_watermark_blocks(layout)
+    # 2. Redaction; matches stay within a text line
+    redacted_layout, redacted_items = redact_blocks(layout, line_ids)
     # 3. Confidence flagging
-    low_confidence_idxs = [i for i, b in enumerate(redacted_layout) if b["confidence"] < CONFIDENCE_THRESHOLD]
+    low_confidence_idxs = np.flatnonzero(redacted_layout.confidences < CONFIDENCE_THRESHOLD).tolist()
     # 4. Filter out watermark blocks from aggregation
-    filtered_blocks = [b for i, b in enumerate(redacted_layout) if i not in watermark_idxs]
+    keep = np.ones(len(redacted_layout), dtype=bool)
+    keep[watermark_idxs] = False
+    filtered_blocks = redacted_layout.take(np.flatnonzero(keep))
     return {
         "layout": redacted_layout,
         "filtered_blocks": filtered_blocks,
-        "watermark_idxs": list(watermark_idxs),
+        "watermark_idxs": watermark_idxs,
         "redacted_items": redacted_items,
         "low_confidence_idxs": low_confidence_idxs
     }
 
-def _process_pdf_document(file_path):
-    """Processes a PDF file, page by page."""
-    doc = fitz.open(file_path)
+def _page_data_from_post(page_data, post):
+    page_data["layout"] = post["layout"]
+    page_data["watermark_blocks"] = post["watermark_idxs"]
+    page_data["redacted_items"] = post["redacted_items"]
+    page_data["low_confidence_blocks"] = post["low_confidence_idxs"]
+    page_data["text"] = " ".join(post["filtered_blocks"].texts)
+    return page_data
+
+def _process_scanned_pages(pages, page_nums, dpis=None):
+    """
+    Renders and OCRs a batch of scanned PDF pages together, so text-line
+    recognition runs in large batches across pages. Returns page dicts in order.
+    The render DPI varies per page, so OCR boxes are converted to PDF points
+    (the units of digital pages); render_dpi records the resolution used.
+    dpis are chosen by the caller (see _choose_render_dpi), so pages render
+    the same whether OCR runs here or in a worker.
+    """
+    if dpis is None:
+        dpis = [_choose_render_dpi(page) for page in pages]
+    # Convert pages to images
+    images = [_convert_page_to_image(page, dpi) for page, dpi in zip(pages, dpis)]
+    # Perform OCR
+    ocr_results = ocr_engine_manager.extract_text_from_images(images)
+    del images
     results = []
-    
-    # Open with pdfplumber for table extraction
-    with pdfplumber.open(file_path) as plumber_doc:
-        for page_num, page in enumerate(doc):
-            page_data = {"page_number": page_num + 1}
+    for page_num, dpi, layout_blocks in zip(page_nums, dpis, ocr_results):
+        page_data = {"page_number": page_num + 1, "type": "scanned_pdf_page", "render_dpi": dpi}
+        layout = _extract_ocr_layout_blocks(layout_blocks, scale=72 / dpi)
+        _page_data_from_post(page_data, _postprocess_layout(layout, block_line_ids(layout)))
+        page_data["tables"] = []  # Table extraction for scanned pages: future work
+        results.append(page_data)
+    return results
+
+def _process_digital_page(page, page_num, words, textpage, get_plumber_page):
+    """
+    Extracts the layout and tables of a single digital PDF page.
+    get_plumber_page(page_num) is only called for pages that may contain tables.
+    """
+    page_data = {"page_number": page_num + 1, "type": "digital_pdf_page"}
+    layout = _extract_digital_pdf_layout(page, words, textpage)
+    _page_data_from_post(page_data, _postprocess_layout(layout, _word_line_ids(words)))
+    # Table extraction
+    if _page_may_have_tables(page):
+        page_data["tables"] = _extract_tables_from_pdfplumber(get_plumber_page(page_num))
+    else:
+        page_data["tables"] = []
+    return page_data
+
+def _finish_page(page_data, parse_state=None):
+    # Parse for Udyam fields
+    doc_type, parsed, field_boxes, skipped = _parse_document_type(
+        page_data["text"], _parse_layout(page_data), parse_state
+    )
+    page_data["document_type"] = doc_type
+    page_data["parsed_fields"] = parsed
+    page_data["parsed_field_boxes"] = field_boxes
+    page_data["skipped_parsers"] = skipped
+    return page_data
+
+# Per-worker state: the PDF (by path) most recently opened by this worker process.
+# Consecutive pages of a document usually land on the same worker, so the
+# document is parsed once per worker instead of once per page.
+_worker_document = None
+
+def _init_page_worker(languages):
+    """Pool initializer: loads and warms the OCR models once per worker process."""
+    ocr_engine_manager.preload(languages)
+
+def _open_pdf(source):
+    """Opens a PDF from a path or from its bytes."""
+    if isinstance(source, str):
+        return fitz.open(source)
+    return fitz.open(stream=source, filetype="pdf")
+
+def _open_plumber(source):
+    return pdfplumber.open(source if isinstance(source, str) else io.BytesIO(source))
+
+def _decode_image(data):
+    """
+    Decodes an in-memory image to a BGR array: the channel order PaddleOCR
+    gets from cv2.imread for a path, so both routes OCR the same pixels.
+    """
+    with Image.open(io.BytesIO(data)) as img:
+        return np.ascontiguousarray(np.asarray(img.convert("RGB"))[:, :, ::-1])
+
+def _open_worker_document(path):
+    global _worker_document
+    if _worker_document is None or _worker_document[0] != path:
+        if _worker_document is not None:
+            _worker_document[1].close()
+        _worker_document = (path, _open_pdf(path))
+    return _worker_document[1]
 
+def _page_subset(doc, page_nums):
+    """The given pages as a small standalone PDF, shared resources copied once."""
+    subset = fitz.open()
+    for n in page_nums:
+        subset.insert_pdf(doc, from_page=n, to_page=n)
+    try:
+        return subset.tobytes(garbage=1)
+    finally:
+        subset.close()
+
+def _process_scanned_pages_in_worker(source, page_nums, dpis):
+    """
+    OCRs pages in a worker at the DPIs the parent chose. source is the
+    document's path (opened once per worker), or the bytes of a PDF holding
+    exactly these pages (_page_subset), so an in-memory document is never
+    shipped whole to every batch.
+    """
+    if isinstance(source, str):
+        doc = _open_worker_document(source)
+        return _process_scanned_pages([doc[n] for n in page_nums], page_nums, dpis)
+    with _open_pdf(source) as subset:
+        return _process_scanned_pages(list(subset), page_nums, dpis)
+
+class WorkerPool(ProcessPoolExecutor):
+    """
+    Process pool whose workers each warm their OCR engines once. Keeps its
+    size, which sets batch sizes and look-ahead, and its languages, so an
+    identical pool can replace it if a worker dies.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, languages=None):
+        self.workers = workers
+        self.languages = list(DEFAULT_OCR_LANGUAGES if languages is None else languages)
+        super().__init__(max_workers=workers, initializer=_init_page_worker, initargs=(self.languages,))
+
+def create_worker_pool(workers=DEFAULT_WORKERS, languages=None):
+    """
+    Creates a WorkerPool; it can be passed to process_document and reused
+    across documents.
+    """
+    return WorkerPool(workers, languages)
+
+def _iter_pdf_document(source, workers=1, pool=None, parse_state=None, start_page=0):
+    """
+    Processes a PDF, given as a path or as bytes, page by page from
+    start_page (0-based), yielding each page as soon as it and all earlier
+    pages are finished.
+    Consecutive scanned pages are OCR'd in batches of up to OCR_BATCH_PAGES;
+    batches run in a process pool when workers > 1 (or a pool is given).
+    Pages are always yielded in document order, which is also the order
+    they are fed to parse_state.
+    """
+    doc = _open_pdf(source)
+    # Each entry is a list of finished page dicts, or a Future of one
+    pending = deque()
+    own_pool = None
+    plumber_doc = None
+    # A pool passed in sets the batch size and look-ahead, whatever workers says
+    pool_size = pool.workers if pool is not None else workers if workers > 1 else DEFAULT_WORKERS
+    max_ahead = pool_size * TASKS_AHEAD_PER_WORKER
+    batch_pages = OCR_BATCH_PAGES
+    scanned = []  # (page_num, page, words) waiting to be OCR'd as one batch
+
+    def get_plumber_page(page_num):
+        # pdfplumber is only opened once a page actually needs table extraction
+        nonlocal plumber_doc
+        if plumber_doc is None:
+            plumber_doc = _open_plumber(source)
+        return plumber_doc.pages[page_num]
+
+    def flush_scanned():
+        page_nums = [n for n, _, _ in scanned]
+        # Chosen here, where the text layer is at hand, so a worker renders the same pixels
+        dpis = [_choose_render_dpi(page, words) for _, page, words in scanned]
+        if pool is not None:
+            # Paths are opened by the workers; bytes go over as just these pages
+            batch_source = source if isinstance(source, str) else _page_subset(doc, page_nums)
+            pending.append(pool.submit(_process_scanned_pages_in_worker, batch_source, page_nums, dpis))
+        else:
+            pending.append(_process_scanned_pages([p for _, p, _ in scanned], page_nums, dpis))
+        scanned.clear()
+
+    def ready_pages():
+        # Yield every finished entry at the head of the queue; wait for the
+        # oldest entry while too many are in flight.
+        while pending and (len(pending) > max_ahead or not isinstance(pending[0], Future) or pending[0].done()):
+            head = pending.popleft()
+            for page_data in (head.result() if isinstance(head, Future) else head):
+                yield _finish_page(page_data, parse_state)
+
+    try:
+        for page_num, page in enumerate(doc.pages(start_page), start_page):
             # 1. Attempt to extract text directly
-            text = page.get_text()
+            words, textpage = _extract_page_words(page)
 
             # 2. Check if the page is likely scanned or text-based
-            if len(text.strip()) < MIN_TEXT_LENGTH_FOR_DIGITAL:
-                page_data["type"] = "scanned_pdf_page"
+            if _text_length(words) < MIN_TEXT_LENGTH_FOR_DIGITAL:
                 print(f"Page {page_num + 1} seems to be scanned. Performing OCR.")
-                
-                # Convert page to image
-                image_np = _convert_page_to_image(page)
-                
-                # Perform OCR
-                layout_blocks = ocr_engine_manager.extract_text_from_image(image_np)
-                layout = _extract_ocr_layout_blocks(layout_blocks)
-                post = _postprocess_layout(layout)
-                page_data["layout"] = post["layout"]
-                page_data["watermark_blocks"] = post["watermark_idxs"]
-                page_data["redacted_items"] = post["redacted_items"]
-                page_data["low_confidence_blocks"] = post["low_confidence_idxs"]
-                page_data["text"] = " ".join([b["text"] for b in post["filtered_blocks"]])
-                page_data["tables"] = []  # Table extraction for scanned pages: future work
-
+                if pool is None and workers > 1:
+                    pool = own_pool = create_worker_pool(workers)
+                if pool is not None:
+                    # Keep every worker busy on short documents
+                    batch_pages = max(1, min(OCR_BATCH_PAGES, len(doc) // pool_size))
+                scanned.append((page_num, page, words))
+                if len(scanned) >= batch_pages:
+                    flush_scanned()
             else:
-                page_data["type"] = "digital_pdf_page"
+                if scanned:
+                    flush_scanned()
                 print(f"Page {page_num + 1} is a digital PDF. Extracting text layer, layout, and tables.")
-                layout = _extract_digital_pdf_layout(page)
-                post = _postprocess_layout(layout)
-                page_data["layout"] = post["layout"]
-                page_data["watermark_blocks"] = post["watermark_idxs"]
-                page_data["redacted_items"] = post["redacted_items"]
-                page_data["low_confidence_blocks"] = post["low_confidence_idxs"]
-                page_data["text"] = " ".join([b["text"] for b in post["filtered_blocks"]])
-                # Table extraction
-                plumber_page = plumber_doc.pages[page_num]
-                tables = _extract_tables_from_pdfplumber(plumber_page)
-                page_data["tables"] = tables
-
-            # Parse for Udyam fields
-            doc_type, parsed = _parse_document_type(page_data["text"])
-            page_data["document_type"] = doc_type
-            page_data["parsed_fields"] = parsed
-            results.append(page_data)
-        
-    doc.close()
-    return results
+                pending.append([_process_digital_page(page, page_num, words, textpage, get_plumber_page)])
 
-def _process_image_document(file_path):
-    """Processes a single image file."""
+            yield from ready_pages()
+
+        if scanned:
+            flush_scanned()
+        while pending:
+            head = pending.popleft()
+            for page_data in (head.result() if isinstance(head, Future) else head):
+                yield _finish_page(page_data, parse_state)
+    finally:
+        for head in pending:
+            if isinstance(head, Future):
+                head.cancel()
+        if own_pool is not None:
+            own_pool.shutdown()
+        if plumber_doc is not None:
+            plumber_doc.close()
+        doc.close()
+
+def _iter_image_document(source, parse_state=None):
+    """Processes a single image, given as a path or as encoded bytes."""
     print("Image document detected. Performing OCR.")
-    layout_blocks = ocr_engine_manager.extract_text_from_image(file_path)
+    image = source if isinstance(source, str) else _decode_image(source)
+    layout_blocks = ocr_engine_manager.extract_text_from_image(image)
     layout = _extract_ocr_layout_blocks(layout_blocks)
-    post = _postprocess_layout(layout)
-    text = " ".join([b["text"] for b in post["filtered_blocks"]])
-    doc_type, parsed = _parse_document_type(text)
+    post = _postprocess_layout(layout, block_line_ids(layout))
+    text = " ".join(post["filtered_blocks"].texts)
+    doc_type, parsed, field_boxes, skipped = _parse_document_type(text, post["filtered_blocks"], parse_state)
     page_data = {
         "page_number": 1,
         "type": "image",
@@ -159,23 +442,110 @@ def _process_image_document(file_path):
         "text": text,
         "document_type": doc_type,
         "parsed_fields": parsed,
+        "parsed_field_boxes": field_boxes,
+        "skipped_parsers": skipped,
         "tables": []  # Table extraction for images: future work
     }
     
-    return [page_data]
+    yield page_data
+
+def _pipeline_namespace():
+    """Settings that affect page output; part of every result cache key."""
+    return json.dumps({
+        "min_text_length_for_digital": MIN_TEXT_LENGTH_FOR_DIGITAL,
+        "confidence_threshold": CONFIDENCE_THRESHOLD,
+        "render_dpi": [MIN_RENDER_DPI, MAX_RENDER_DPI, TARGET_GLYPH_HEIGHT_PX, MAX_RENDER_MEGAPIXELS],
+        "render_grayscale": RENDER_GRAYSCALE,
+        # Scanned-page OCR boxes are in PDF points since render DPIs vary per page
+        "scanned_box_units": "pt",
+        "ocr_languages": DEFAULT_OCR_LANGUAGES,
+    }, sort_keys=True)
+
+def document_cache_key(cache, source):
+    """Result cache key for a document (path or bytes): content hash plus pipeline settings."""
+    if isinstance(source, str):
+        return cache.key_for_file(source, _pipeline_namespace())
+    return cache.key_for_bytes(source, _pipeline_namespace())
+
+def _iter_and_cache(pages, cache, key):
+    # The entry is only published once every page was produced
+    writer = cache.writer(key)
+    completed = False
+    try:
+        for page_data in pages:
+            writer.write(page_data)
+            yield page_data
+        completed = True
+    finally:
+        if completed:
+            writer.commit()
+        else:
+            writer.abort()
 
+def feed_parse_state(parse_state, pages):
+    """Feeds already processed pages (e.g. from a cache or a job queue) to a DocumentParseState."""
+    for page_data in pages:
+        parse_state.feed(page_data["text"], _parse_layout(page_data))
 
-def process_document(file_path):
+def _iter_cached(pages, parse_state):
+    for page_data in pages:
+        if parse_state is not None:
+            feed_parse_state(parse_state, [page_data])
+        yield page_data
+
+def process_document_iter(source, workers=1, pool=None, cache=None, parse_state=None, start_page=0, name=None):
     """
-    Main function to process a document.
-    It identifies the file type and calls the appropriate processor.
+    Streaming variant of process_document: returns an iterator that yields
+    each page dict, in page order, as soon as it is finished.
+    source is a file path, the document's bytes, or a binary file-like
+    object; in-memory documents are never written to disk. Their type comes
+    from name (or the object's name), else from the content.
+    With a core.cache.ResultCache, previously processed content is served
+    from the cache and new results are stored as they stream by.
+    With a DocumentParseState (parser_registry.start_document()), every page
+    is fed to it as it streams by; call its finish() once the iterator is
+    exhausted for the document-level fields.
+    start_page (0-based) skips the pages before it, e.g. to resume an
+    interrupted document; such partial runs are not stored in the cache.
+    Raises ValueError for unsupported file types.
     """
-    _, file_extension = os.path.splitext(file_path.lower())
-    
+    path, data, file_extension, label = read_source(source, name)
+
+    if file_extension not in SUPPORTED_EXTENSIONS:
+        raise ValueError(f"Unsupported file type '{file_extension}'")
+
+    document = path if path is not None else data
+    if cache is not None:
+        key = document_cache_key(cache, document)
+        cached = cache.get(key)
+        if cached is not None:
+            print(f"Using cached results for {label}")
+            return _iter_cached(cached[start_page:], parse_state)
+
     if file_extension == ".pdf":
-        return _process_pdf_document(file_path)
-    elif file_extension in [".png", ".jpg", ".jpeg", ".tiff", ".bmp"]:
-        return _process_image_document(file_path)
+        pages = _iter_pdf_document(document, workers=workers, pool=pool, parse_state=parse_state, start_page=start_page)
+    elif start_page > 0:
+        pages = iter([])
     else:
-        print(f"Error: Unsupported file type '{file_extension}'")
-        return None 
\ No newline at end of file
+        pages = _iter_image_document(document, parse_state=parse_state)
+
+    if cache is not None and start_page == 0:
+        return _iter_and_cache(pages, cache, key)
+    return pages
+
+def process_document(source, workers=1, pool=None, cache=None, name=None, parse_state=None):
+    """
+    Main function to process a document.
+    It identifies the file type and calls the appropriate processor.
+    source is a file path, bytes or a binary file-like object (see
+    process_document_iter).
+    workers > 1 OCRs scanned PDF pages in parallel; pass a pool from
+    create_worker_pool to reuse warm workers across documents.
+    With a DocumentParseState, its finish() gives the document-level fields.
+    """
+    try:
+        pages = process_document_iter(source, workers=workers, pool=pool, cache=cache, parse_state=parse_state, name=name)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return None
+    return list(pages)
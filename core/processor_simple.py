@@ -1,9 +1,10 @@
-import os
+import io
 import numpy as np
 from PIL import Image
 import pdfplumber
-from .language.detect import detect_language
-from .parsing.udhyam_parser import parse_udhyam
+from .language.script import classify_tokens
+from .parsing.registry import parser_registry
+from .source import read_source
 
 # A threshold to decide if a PDF page is scanned.
 # If the text extracted from the text layer is less than this, we assume it's scanned.
@@ -16,10 +17,11 @@ def _extract_digital_pdf_layout(page):
     
     # Extract text with positioning
     words = page.extract_words()
-    for word in words:
+    # Script-based language per word; Latin words fall back to langdetect per text line
+    languages = classify_tokens([w['text'] for w in words], groups=[round(w['top']) for w in words])
+    for word, lang in zip(words, languages):
         x0, y0, x1, y1 = word['x0'], word['top'], word['x1'], word['bottom']
         text = word['text']
-        lang = detect_language(text)
         layout_blocks.append({
             "bbox": [x0, y0, x1, y1],
             "text": text,
@@ -31,10 +33,11 @@ def _extract_digital_pdf_layout(page):
 
 def _extract_ocr_layout_blocks(layout_blocks):
     """Convert OCR output to a standard format."""
+    # Each OCR block is a text line, so Latin lines fall back to langdetect per block
+    languages = classify_tokens([text for _, (text, _) in layout_blocks], groups=range(len(layout_blocks)))
     result = []
-    for block in layout_blocks:
+    for block, lang in zip(layout_blocks, languages):
         bbox, (text, conf) = block
-        lang = detect_language(text)
         result.append({
             "bbox": bbox,
             "text": text,
@@ -43,15 +46,10 @@ def _extract_ocr_layout_blocks(layout_blocks):
         })
     return result
 
-def _parse_document_type(text):
+def _parse_document_type(text, layout=None):
     """Parse document type and extract fields."""
-    # For now, always try Udyam parser
-    parsed = parse_udhyam(text)
-    if parsed:
-        doc_type = "Udyam_Certificate"
-    else:
-        doc_type = "Unknown"
-    return doc_type, parsed
+    # Only parsers whose anchor phrases occur in the text are run
+    return parser_registry.parse(text, layout)
 
 def _extract_tables_from_pdfplumber(pdfplumber_page):
     """Extract tables from a PDF page."""
@@ -76,11 +74,11 @@ def _postprocess_layout(layout):
         "low_confidence_idxs": low_confidence_idxs
     }
 
-def _process_pdf_document(file_path):
-    """Processes a PDF file, page by page using pdfplumber only."""
+def _process_pdf_document(source):
+    """Processes a PDF (path or bytes), page by page using pdfplumber only."""
     results = []
     
-    with pdfplumber.open(file_path) as doc:
+    with pdfplumber.open(source if isinstance(source, str) else io.BytesIO(source)) as doc:
         for page_num, page in enumerate(doc.pages):
             page_data = {"page_number": page_num + 1}
 
@@ -99,6 +97,7 @@ def _process_pdf_document(file_path):
                 page_data["low_confidence_blocks"] = []
                 page_data["text"] = text
                 page_data["tables"] = []
+                parse_layout = None
 
             else:
                 page_data["type"] = "digital_pdf_page"
@@ -111,21 +110,26 @@ def _process_pdf_document(file_path):
                 page_data["redacted_items"] = post["redacted_items"]
                 page_data["low_confidence_blocks"] = post["low_confidence_idxs"]
                 page_data["text"] = " ".join([b["text"] for b in post["filtered_blocks"]])
+                parse_layout = post["filtered_blocks"]
                 
                 # Table extraction
                 tables = _extract_tables_from_pdfplumber(page)
                 page_data["tables"] = tables
 
             # Parse for Udyam fields
-            doc_type, parsed = _parse_document_type(page_data["text"])
+            doc_type, parsed, field_boxes, skipped = _parse_document_type(
+                page_data["text"], parse_layout
+            )
             page_data["document_type"] = doc_type
             page_data["parsed_fields"] = parsed
+            page_data["parsed_field_boxes"] = field_boxes
+            page_data["skipped_parsers"] = skipped
             results.append(page_data)
         
     return results
 
-def _process_image_document(file_path):
-    """Processes a single image file."""
+def _process_image_document(source):
+    """Processes a single image (path or bytes)."""
     print("Image document detected. OCR not available in simplified version.")
     
     # For now, just return basic info
@@ -139,22 +143,34 @@ def _process_image_document(file_path):
         "text": "",
         "document_type": "Unknown",
         "parsed_fields": {},
+        "parsed_field_boxes": {},
+        "skipped_parsers": [],
         "tables": []
     }
     
     return [page_data]
 
-def process_document(file_path):
+def warm_up():
+    """
+    Loads the lazily initialized models (language profiles, parser patterns)
+    now, so the first document does not pay for them.
+    """
+    classify_tokens(["warm", "up"])
+    parser_registry.classify("")
+
+def process_document(source, name=None):
     """
     Main function to process a document.
     It identifies the file type and calls the appropriate processor.
+    source is a file path, bytes or a binary file-like object; name gives
+    the file type of in-memory input (else it is detected from the content).
     """
-    _, file_extension = os.path.splitext(file_path.lower())
+    path, data, file_extension, _ = read_source(source, name)
     
     if file_extension == ".pdf":
-        return _process_pdf_document(file_path)
+        return _process_pdf_document(path if path is not None else data)
     elif file_extension in [".png", ".jpg", ".jpeg", ".tiff", ".bmp"]:
-        return _process_image_document(file_path)
+        return _process_image_document(path if path is not None else data)
     else:
         print(f"Error: Unsupported file type '{file_extension}'")
-        return None 
\ No newline at end of file
+        return None
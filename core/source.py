@@ -0,0 +1,40 @@
+import os
+
+# Leading bytes of the supported formats, for in-memory input without a name
+MAGIC_EXTENSIONS = [
+    (b"%PDF", ".pdf"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"II*\x00", ".tiff"),
+    (b"MM\x00*", ".tiff"),
+    (b"BM", ".bmp"),
+]
+
+def sniff_extension(data):
+    """File extension matching the content's magic bytes, or '' if unknown."""
+    head = bytes(data[:8])
+    for magic, extension in MAGIC_EXTENSIONS:
+        if head.startswith(magic):
+            return extension
+    return ""
+
+def read_source(source, name=None):
+    """
+    Normalizes a document source: a file path, bytes, or a binary file-like
+    object (e.g. an upload). Returns (path, data, extension, label) where
+    exactly one of path and data is set. For in-memory input the type comes
+    from name (or the object's .name), else from the content itself.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        _, extension = os.path.splitext((name or path).lower())
+        return path, None, extension, path
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source)
+    else:
+        name = name or getattr(source, "name", None)
+        data = source.getvalue() if hasattr(source, "getvalue") else source.read()
+    _, extension = os.path.splitext((name or "").lower())
+    if not extension:
+        extension = sniff_extension(data)
+    return None, data, extension, name or "<memory>"
@@ -23,6 +23,7 @@ def create_deployment_package():
     # Files to include
     files_to_copy = [
         "streamlit_app_cloud.py",
+        "api/streamlit_cache.py",
         "requirements_cloud.txt",
         "Procfile",
         "runtime.txt",
@@ -45,6 +46,7 @@ def create_deployment_package():
     for file_name in files_to_copy:
         src = Path(file_name)
         if src.exists():
+            (deploy_dir / file_name).parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(src, deploy_dir / file_name)
             print(f"✅ Copied {file_name}")
         else:
@@ -164,6 +166,7 @@ def validate_deployment_package(deploy_dir):
     
     required_files = [
         "streamlit_app_cloud.py",
+        "api/streamlit_cache.py",
         "requirements_cloud.txt",
         "core/processor_simple.py",
         "core/language/detect.py",
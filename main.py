@@ -1,58 +1,215 @@
 import argparse
 import os
-from core.processor import process_document
+import sys
+from core.processor import process_document_iter
+from core.parsing.registry import parser_registry
+from core.cache import ResultCache
+from core.batch import BatchStats, collect_inputs, process_batch
 from core.output.json_output import write_json
+from core.output.jsonl_output import JsonlWriter, write_jsonl
+from core.output.streams import compressed_path, compression_available
+from core.output.columnar_output import COLUMNAR_FORMATS, ColumnarExporter
 from core.output.csv_output import write_kv_csv, write_tables_csv
 
+def write_page_outputs(base, page_num, page_data, outdir, formats, pretty=False, compression=None):
+    """
+    Saves one page's results in the requested per-page formats.
+    JSON is compact unless pretty; compression ("gzip", "zstd") applies to JSON files.
+    """
+    for fmt in formats:
+        if fmt == "json":
+            outpath = compressed_path(os.path.join(outdir, f"{base}_page{page_num}.json"), compression)
+            write_json(page_data, outpath, pretty=pretty, compression=compression)
+        elif fmt == "csv":
+            outpath = os.path.join(outdir, f"{base}_page{page_num}.csv")
+            write_kv_csv(page_data.get("parsed_fields", {}), outpath)
+            if page_data.get("tables"):
+                prefix = os.path.join(outdir, f"{base}_page{page_num}_table")
+                write_tables_csv(page_data["tables"], prefix)
+
+def write_outputs(file_path, extracted_data, outdir, formats, pretty=False, compression=None):
+    """Saves every page of a document in the requested formats."""
+    base = os.path.splitext(os.path.basename(file_path))[0]
+    for page_num, page_data in enumerate(extracted_data, 1):
+        write_page_outputs(base, page_num, page_data, outdir, formats, pretty, compression)
+    if "jsonl" in formats:
+        write_jsonl(extracted_data, compressed_path(os.path.join(outdir, f"{base}.jsonl"), compression), compression)
+
+def print_page_summary(page_num, page_data):
+    print(f"\n[Page {page_num}] Type: {page_data['type']} Document Type: {page_data.get('document_type','')}")
+    if "parsed_fields" in page_data and page_data["parsed_fields"]:
+        print("  Parsed Fields:")
+        for k, v in page_data["parsed_fields"].items():
+            print(f"    {k}: {v}")
+    else:
+        print("  No structured fields parsed.")
+    if page_data.get("tables"):
+        print(f"  Tables Extracted: {len(page_data['tables'])}")
+    if page_data.get("watermark_blocks"):
+        print(f"  Watermark Blocks: {len(page_data['watermark_blocks'])}")
+    if page_data.get("redacted_items"):
+        print(f"  Redacted Items: {page_data['redacted_items']}")
+    if page_data.get("low_confidence_blocks"):
+        print(f"  Low Confidence Blocks: {len(page_data['low_confidence_blocks'])}")
+
+def print_document_summary(result):
+    print(f"\n[Document] Document Type: {result.doc_type}")
+    if result.fields:
+        print("  Parsed Fields:")
+        for k, v in result.fields.items():
+            print(f"    {k}: {v} (page {result.field_boxes[k]['page']})" if k in result.field_boxes else f"    {k}: {v}")
+    else:
+        print("  No structured fields parsed.")
+
+def document_fields_data(result):
+    return {
+        "document_type": result.doc_type,
+        "parsed_fields": result.fields,
+        "parsed_field_boxes": result.field_boxes,
+    }
+
+def write_document_outputs(file_path, result, args, formats):
+    """Saves the document-level fields (a ParseResult) next to the page outputs."""
+    base = os.path.splitext(os.path.basename(file_path))[0]
+    if "json" in formats:
+        outpath = compressed_path(os.path.join(args.outdir, f"{base}_document.json"), args.compression)
+        write_json(document_fields_data(result), outpath, pretty=args.json_style == "pretty", compression=args.compression)
+    if "csv" in formats:
+        write_kv_csv(result.fields, os.path.join(args.outdir, f"{base}_document.csv"))
+    if args.columnar:
+        args.columnar.add_document_fields(file_path, result.doc_type, result.fields, result.field_boxes)
+
+def run_single(file_path, args, formats, data=None):
+    """Processes one document; with data, file_path only names the in-memory document."""
+    print(f"Processing document: {file_path}")
+    parse_state = parser_registry.start_document()
+    source = file_path if data is None else data
+    try:
+        pages = process_document_iter(source, workers=args.workers, cache=args.cache, parse_state=parse_state, name=file_path)
+    except ValueError as e:
+        print(f"Error: {e}")
+        print("No data was extracted from the document.")
+        return
+
+    # Report and save each page as soon as it is finished
+    base = os.path.splitext(os.path.basename(file_path))[0]
+    pretty, compression = args.json_style == "pretty", args.compression
+    jsonl_path = compressed_path(os.path.join(args.outdir, f"{base}.jsonl"), compression)
+    jsonl_writer = JsonlWriter(jsonl_path, compression) if "jsonl" in formats else None
+    page_count = 0
+    try:
+        for page_num, page_data in enumerate(pages, 1):
+            if page_num == 1:
+                print("\n--- Extracted Data ---")
+            print_page_summary(page_num, page_data)
+            write_page_outputs(base, page_num, page_data, args.outdir, formats, pretty, compression)
+            if jsonl_writer:
+                jsonl_writer.write(page_data)
+            if args.columnar:
+                args.columnar.add_page(file_path, page_data)
+            page_count = page_num
+    finally:
+        if jsonl_writer:
+            jsonl_writer.close()
+
+    if not page_count:
+        print("No data was extracted from the document.")
+    else:
+        # Fields gathered over the whole page stream
+        result = parse_state.finish()
+        print_document_summary(result)
+        write_document_outputs(file_path, result, args, formats)
+    if args.cache:
+        print_cache_stats(args.cache)
+
+def run_batch(file_paths, args, formats):
+    print(f"Processing {len(file_paths)} documents with {args.workers} worker(s)")
+    stats = BatchStats()
+    for file_path, extracted_data, error, document in process_batch(file_paths, workers=args.workers, cache=args.cache):
+        stats.record(extracted_data)
+        if error:
+            print(f"FAILED {file_path}: {error}")
+        elif not extracted_data:
+            print(f"SKIPPED {file_path}: no data extracted")
+        else:
+            write_outputs(file_path, extracted_data, args.outdir, formats, args.json_style == "pretty", args.compression)
+            if args.columnar:
+                for page_data in extracted_data:
+                    args.columnar.add_page(file_path, page_data)
+            write_document_outputs(file_path, document, args, formats)
+            print(f"OK {file_path} ({len(extracted_data)} pages)")
+    summary = stats.summary()
+    print("\n--- Batch Summary ---")
+    print(f"  Documents: {summary['documents']} ({summary['failed']} failed)")
+    print(f"  Pages: {summary['pages']}")
+    print(f"  Elapsed: {summary['seconds']}s")
+    print(f"  Throughput: {summary['docs_per_sec']} docs/sec, {summary['pages_per_sec']} pages/sec")
+    if args.cache:
+        print_cache_stats(args.cache)
+
+def print_cache_stats(cache):
+    stats = cache.stats()
+    print(f"  Result cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%}), {stats['evictions']} evicted")
+
+def run(args, formats):
+    """Dispatches stdin, single-document and batch input."""
+    # A document piped through stdin is processed in memory
+    if args.inputs == ["-"] and not args.manifest:
+        data = sys.stdin.buffer.read()
+        run_single(args.name or "stdin", args, formats, data=data)
+        return
+
+    # A single plain file keeps the detailed per-page report
+    if len(args.inputs) == 1 and not args.manifest and os.path.isfile(args.inputs[0]):
+        run_single(args.inputs[0], args, formats)
+        return
+
+    file_paths = collect_inputs(args.inputs, args.manifest)
+    missing = [p for p in file_paths if not os.path.exists(p)]
+    for file_path in missing:
+        print(f"Error: File not found at '{file_path}'")
+    file_paths = [p for p in file_paths if p not in missing]
+    if not file_paths:
+        print("No documents to process.")
+        return
+    run_batch(file_paths, args, formats)
+
 def main():
-    parser = argparse.ArgumentParser(description="BharatDoc AI-OCR: Process a single document.")
-    parser.add_argument("file_path", type=str, help="The path to the document file (PDF, PNG, JPG).")
+    parser = argparse.ArgumentParser(description="BharatDoc AI-OCR: Process a document, or a batch of documents.")
+    parser.add_argument("inputs", type=str, nargs="*", help="Document files (PDF, PNG, JPG), directories or glob patterns; '-' reads one document from stdin.")
+    parser.add_argument("--name", type=str, help="File name for a document read from stdin (type and output names); detected from the content if omitted.")
+    parser.add_argument("--manifest", type=str, help="File listing one document path, directory or glob per line.")
     parser.add_argument("--outdir", type=str, default="output", help="Directory to save outputs.")
-    parser.add_argument("--formats", type=str, default="json,csv", help="Comma-separated output formats: json,csv")
+    parser.add_argument("--formats", type=str, default="json,csv", help="Comma-separated output formats: json,csv,jsonl,parquet,arrow")
+    parser.add_argument("--partition", type=str, help="Partition value for parquet/arrow output (e.g. a batch name or date).")
+    parser.add_argument("--json-style", choices=["compact", "pretty"], default="compact", help="Compact JSON (smaller, faster) or indented JSON.")
+    parser.add_argument("--compress", dest="compression", choices=["gzip", "zstd"], help="Compress JSON and JSONL outputs while writing (zstd needs the zstandard package).")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes: OCR pages of one document, or whole documents in batch mode (1 = sequential).")
+    parser.add_argument("--cache-dir", type=str, help="Directory for the content-addressed result cache (disabled if omitted).")
+    parser.add_argument("--cache-max-mb", type=int, default=2048, help="Size budget of the result cache in MB (LRU eviction).")
     args = parser.parse_args()
+    args.cache = ResultCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024) if args.cache_dir else None
 
-    if not os.path.exists(args.file_path):
-        print(f"Error: File not found at '{args.file_path}'")
-        return
+    if not compression_available(args.compression):
+        parser.error(f"--compress {args.compression} needs the zstandard package (pip install zstandard)")
+    if not args.inputs and not args.manifest:
+        parser.error("provide at least one document, directory or glob, or --manifest")
 
     os.makedirs(args.outdir, exist_ok=True)
     formats = [fmt.strip() for fmt in args.formats.split(",")]
-
-    print(f"Processing document: {args.file_path}")
-    extracted_data = process_document(args.file_path)
-
-    if extracted_data:
-        print("\n--- Extracted Data ---")
-        for page_num, page_data in enumerate(extracted_data, 1):
-            print(f"\n[Page {page_num}] Type: {page_data['type']} Document Type: {page_data.get('document_type','')}")
-            if "parsed_fields" in page_data and page_data["parsed_fields"]:
-                print("  Parsed Fields:")
-                for k, v in page_data["parsed_fields"].items():
-                    print(f"    {k}: {v}")
-            else:
-                print("  No structured fields parsed.")
-            if page_data.get("tables"):
-                print(f"  Tables Extracted: {len(page_data['tables'])}")
-            if page_data.get("watermark_blocks"):
-                print(f"  Watermark Blocks: {len(page_data['watermark_blocks'])}")
-            if page_data.get("redacted_items"):
-                print(f"  Redacted Items: {page_data['redacted_items']}")
-            if page_data.get("low_confidence_blocks"):
-                print(f"  Low Confidence Blocks: {len(page_data['low_confidence_blocks'])}")
-            # Save outputs
-            base = os.path.splitext(os.path.basename(args.file_path))[0]
-            for fmt in formats:
-                if fmt == "json":
-                    outpath = os.path.join(args.outdir, f"{base}_page{page_num}.json")
-                    write_json(page_data, outpath)
-                elif fmt == "csv":
-                    outpath = os.path.join(args.outdir, f"{base}_page{page_num}.csv")
-                    write_kv_csv(page_data.get("parsed_fields", {}), outpath)
-                    if page_data.get("tables"):
-                        prefix = os.path.join(args.outdir, f"{base}_page{page_num}_table")
-                        write_tables_csv(page_data["tables"], prefix)
-    else:
-        print("No data was extracted from the document.")
+    columnar = [fmt for fmt in formats if fmt in COLUMNAR_FORMATS]
+    if len(columnar) > 1:
+        parser.error("choose either parquet or arrow output, not both")
+    try:
+        # One exporter for the whole run: blocks, pages and fields tables under <outdir>/columnar
+        args.columnar = ColumnarExporter(os.path.join(args.outdir, "columnar"), columnar[0], args.partition) if columnar else None
+    except ImportError as e:
+        parser.error(str(e))
+    try:
+        run(args, formats)
+    finally:
+        if args.columnar:
+            args.columnar.close()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
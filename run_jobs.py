@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Durable job queue for document processing (SQLite, see core/jobs.py).
+
+    python run_jobs.py submit data/ "scans/**/*.pdf" --manifest backfill.txt
+    python run_jobs.py work --processes 4          # run until stopped
+    python run_jobs.py work --processes 4 --drain  # exit once the queue is empty
+    python run_jobs.py status
+    python run_jobs.py export --outdir output
+
+Workers can be started and stopped at any time; a job interrupted by a
+crash is picked up again after its lease expires and resumes from its first
+unfinished page.
+"""
+
+import argparse
+import multiprocessing
+import os
+from core.batch import collect_inputs
+from core.jobs import DEFAULT_LEASE_SECONDS, DONE, JobQueue, run_worker
+from core.output.json_output import write_json
+from core.output.streams import compressed_path, compression_available
+from main import write_outputs
+
+DEFAULT_DB = "jobs.sqlite3"
+
+def cmd_submit(args):
+    file_paths = collect_inputs(args.inputs, args.manifest)
+    missing = [p for p in file_paths if not os.path.exists(p)]
+    for file_path in missing:
+        print(f"Error: File not found at '{file_path}'")
+    file_paths = [p for p in file_paths if p not in missing]
+    queue = JobQueue(args.db)
+    ids = queue.submit(file_paths)
+    queue.close()
+    print(f"Queued {len(ids)} job(s)")
+
+def cmd_work(args):
+    kwargs = {"exit_when_idle": args.drain, "lease_seconds": args.lease}
+    if args.processes <= 1:
+        run_worker(args.db, **kwargs)
+        return
+    workers = [multiprocessing.Process(target=run_worker, args=(args.db,), kwargs=kwargs) for _ in range(args.processes)]
+    for worker in workers:
+        worker.start()
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+
+def cmd_status(args):
+    queue = JobQueue(args.db)
+    counts = queue.counts()
+    print("  ".join(f"{status}: {n}" for status, n in sorted(counts.items())) or "No jobs.")
+    if args.verbose:
+        for job in queue.jobs():
+            line = f"  #{job['id']} {job['status']:<8} pages {job['pages_done']:<4} attempts {job['attempts']}  {job['path']}"
+            print(line + (f"  ({job['error']})" if job["error"] else ""))
+    queue.close()
+
+def cmd_export(args):
+    os.makedirs(args.outdir, exist_ok=True)
+    formats = [fmt.strip() for fmt in args.formats.split(",")]
+    pretty = args.json_style == "pretty"
+    queue = JobQueue(args.db)
+    for job in queue.jobs(DONE):
+        write_outputs(job["path"], queue.pages(job["id"]), args.outdir, formats, pretty, args.compression)
+        document = queue.document(job["id"])
+        if document and "json" in formats:
+            base = os.path.splitext(os.path.basename(job["path"]))[0]
+            outpath = compressed_path(os.path.join(args.outdir, f"{base}_document.json"), args.compression)
+            write_json(document, outpath, pretty=pretty, compression=args.compression)
+        print(f"Exported job {job['id']}: {job['path']}")
+    queue.close()
+
+def cmd_retry(args):
+    queue = JobQueue(args.db)
+    print(f"Re-queued {queue.retry_failed()} failed job(s)")
+    queue.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="BharatDoc AI-OCR: durable job queue.")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB, help="SQLite database holding the queue.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    submit = commands.add_parser("submit", help="Queue documents, directories or glob patterns.")
+    submit.add_argument("inputs", type=str, nargs="*")
+    submit.add_argument("--manifest", type=str, help="File listing one document path, directory or glob per line.")
+    submit.set_defaults(func=cmd_submit)
+
+    work = commands.add_parser("work", help="Process queued jobs.")
+    work.add_argument("--processes", type=int, default=1, help="Worker processes claiming jobs.")
+    work.add_argument("--drain", action="store_true", help="Exit when no job is left instead of waiting for more.")
+    work.add_argument("--lease", type=int, default=DEFAULT_LEASE_SECONDS, help="Seconds without progress before a running job is reclaimed.")
+    work.set_defaults(func=cmd_work)
+
+    status = commands.add_parser("status", help="Show job counts.")
+    status.add_argument("-v", "--verbose", action="store_true", help="List every job.")
+    status.set_defaults(func=cmd_status)
+
+    export = commands.add_parser("export", help="Write the results of finished jobs.")
+    export.add_argument("--outdir", type=str, default="output")
+    export.add_argument("--formats", type=str, default="json,csv", help="Comma-separated output formats: json,csv,jsonl")
+    export.add_argument("--json-style", choices=["compact", "pretty"], default="compact")
+    export.add_argument("--compress", dest="compression", choices=["gzip", "zstd"], help="Compress JSON and JSONL outputs.")
+    export.set_defaults(func=cmd_export)
+
+    retry = commands.add_parser("retry", help="Queue failed jobs again.")
+    retry.set_defaults(func=cmd_retry)
+
+    args = parser.parse_args()
+    if args.command == "export" and not compression_available(args.compression):
+        export.error(f"--compress {args.compression} needs the zstandard package (pip install zstandard)")
+    if args.command == "submit" and not args.inputs and not args.manifest:
+        submit.error("provide at least one document, directory or glob, or --manifest")
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
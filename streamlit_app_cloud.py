@@ -6,7 +6,6 @@ No local dependencies required!
 """
 
 import streamlit as st
-import tempfile
 import os
 import sys
 from pathlib import Path
@@ -16,9 +15,8 @@ current_dir = Path(__file__).parent
 sys.path.append(str(current_dir))
 
 try:
-    from core.processor_simple import process_document
-    from core.output.json_output import write_json
-    from core.output.csv_output import write_kv_csv, write_tables_csv
+    from core.output.archive import page_file_names
+    from api.streamlit_cache import build_downloads, load_engines, process_upload, upload_digest
 except ImportError as e:
     st.error(f"Import error: {e}")
     st.info("Please ensure all core modules are available in the deployment package.")
@@ -115,24 +113,31 @@ def main():
     if uploaded_files:
         st.markdown("### 🔄 Processing Results")
         
+        load_engines()
+        
         # Process each uploaded file
         for uploaded_file in uploaded_files:
             with st.expander(f"📄 {uploaded_file.name}", expanded=True):
                 st.write(f"**File Type:** {uploaded_file.type}")
                 st.write(f"**File Size:** {uploaded_file.size} bytes")
                 
-                # Create temporary file
-                with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[1]) as tmp:
-                    tmp.write(uploaded_file.read())
-                    tmp_path = tmp.name
-                
                 try:
-                    # Process document
+                    # Process document straight from the upload buffer
+                    data = uploaded_file.getvalue()
                     with st.spinner(f"Processing {uploaded_file.name}..."):
-                        results = process_document(tmp_path)
+                        digest = upload_digest(data)
+                        results = process_upload(digest, uploaded_file.name, data)
                     
                     if results:
                         st.success(f"✅ Successfully processed {uploaded_file.name}")
+                        files, archive = build_downloads(digest, uploaded_file.name, results)
+                        base = os.path.splitext(uploaded_file.name)[0]
+                        st.download_button(
+                            label="🗂️ Download All (ZIP)",
+                            data=archive,
+                            file_name=f"{base}.zip",
+                            mime="application/zip"
+                        )
                         
                         # Display results for each page
                         for page in results:
@@ -171,49 +176,33 @@ def main():
                             
                             # Download options
                             st.markdown("**💾 Download Results:**")
-                            base = os.path.splitext(uploaded_file.name)[0]
+                            names = page_file_names(base, page)
                             
                             # JSON download
-                            json_name = f"{base}_page{page['page_number']}.json"
-                            with tempfile.NamedTemporaryFile(delete=False, suffix=".json") as jf:
-                                write_json(page, jf.name)
-                                with open(jf.name, "rb") as f:
-                                    st.download_button(
-                                        label="📄 Download JSON",
-                                        data=f.read(),
-                                        file_name=json_name,
-                                        mime="application/json"
-                                    )
-                                os.unlink(jf.name)
+                            st.download_button(
+                                label="📄 Download JSON",
+                                data=files[names["json"]],
+                                file_name=names["json"],
+                                mime="application/json"
+                            )
                             
                             # CSV download
-                            csv_name = f"{base}_page{page['page_number']}.csv"
-                            with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as cf:
-                                write_kv_csv(page.get("parsed_fields", {}), cf.name)
-                                with open(cf.name, "rb") as f:
+                            st.download_button(
+                                label="📊 Download CSV (Fields)",
+                                data=files[names["csv"]],
+                                file_name=names["csv"],
+                                mime="text/csv"
+                            )
+                            
+                            # Table CSVs
+                            for idx, (tname, table) in enumerate(zip(names["tables"], page.get("tables") or []), 1):
+                                if table and len(table) > 0:
                                     st.download_button(
-                                        label="📊 Download CSV (Fields)",
-                                        data=f.read(),
-                                        file_name=csv_name,
+                                        label=f"📊 Download Table {idx} CSV",
+                                        data=files[tname],
+                                        file_name=tname,
                                         mime="text/csv"
                                     )
-                                os.unlink(cf.name)
-                            
-                            # Table CSVs
-                            if page.get("tables"):
-                                for idx, table in enumerate(page["tables"], 1):
-                                    if table and len(table) > 0:
-                                        tname = f"{base}_page{page['page_number']}_table{idx}.csv"
-                                        with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as tf:
-                                            write_tables_csv([table], tf.name[:-4])
-                                            with open(tf.name, "rb") as f:
-                                                st.download_button(
-                                                    label=f"📊 Download Table {idx} CSV",
-                                                    data=f.read(),
-                                                    file_name=tname,
-                                                    mime="text/csv"
-                                                )
-                                            os.unlink(tf.name)
                     
                     else:
                         st.error(f"❌ Failed to process {uploaded_file.name}")
@@ -221,13 +210,6 @@ def main():
                 except Exception as e:
                     st.error(f"❌ Error processing {uploaded_file.name}: {str(e)}")
                     st.info("This might be due to file format issues or processing limitations.")
-                
-                finally:
-                    # Clean up temporary file
-                    try:
-                        os.unlink(tmp_path)
-                    except:
-                        pass
     else:
         # Show instructions when no files are uploaded
         st.markdown("### 📋 Instructions")
@@ -78,6 +78,12 @@ def test_language_detection():
         english_text = "Udyam Registration Certificate"
         lang = detect_language(english_text)
         print(f"✓ English text detected as: {lang}")
+
+        # Test script-based classification of a token array
+        from core.language.script import classify_tokens
+        langs = classify_tokens(["उद्यम", "பதிவு", "Udyam", "Registration", "2021"])
+        assert langs[:2] == ["hi", "ta"] and langs[4] is None, langs
+        print(f"✓ Token scripts classified as: {langs}")
         
         return True
     except Exception as e:
@@ -111,6 +117,41 @@ def test_udhyam_parser():
         print(f"✗ Udyam parser test failed: {e}")
         return False
 
+def test_redaction():
+    """Test redaction of values split over several blocks."""
+    print("\nTesting redaction...")
+    
+    try:
+        from core.parsing.layout_kv import block_line_ids
+        from core.postprocessing.redact import REDACTED_STR, redact_blocks
+        
+        # Digital words of one line: line ids are (block_no, line_no)
+        words = [{"text": t, "bbox": [0, 0, 1, 1]} for t in ["Aadhaar:", "1234", "5678", "9012"]]
+        _, found = redact_blocks(words, [(0, 0)] * 4)
+        assert found == [("AADHAAR", "1234 5678 9012")], found
+        print("✓ Number split over digital words redacted")
+        
+        # OCR boxes of one line, line ids from their quads
+        def quad(x0, y0, x1, y1):
+            return [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+        boxes = [{"text": t, "bbox": quad(50 + 60 * i, 100 + i, 100 + 60 * i, 112 + i)}
+                 for i, t in enumerate(["1234", "5678", "9012"])]
+        redacted, found = redact_blocks(boxes, block_line_ids(boxes))
+        assert [b["text"] for b in redacted] == [REDACTED_STR] * 3, redacted
+        print("✓ Number split over OCR boxes redacted")
+        
+        # Numbers in separate lines must not combine
+        rows = [{"text": t, "bbox": quad(50, 100 + 20 * i, 100, 112 + 20 * i)}
+                for i, t in enumerate(["2023", "1000", "2500"])]
+        redacted, found = redact_blocks(rows, block_line_ids(rows))
+        assert found == [] and redacted == rows, found
+        print("✓ Numbers on separate lines left alone")
+        
+        return True
+    except Exception as e:
+        print(f"✗ Redaction test failed: {e!r}")
+        return False
+
 def test_pdf_processing():
     """Test PDF processing functionality."""
     print("\nTesting PDF processing...")
@@ -148,6 +189,11 @@ def main():
         print("\n❌ Udyam parser tests failed.")
         return False
     
+    # Test redaction
+    if not test_redaction():
+        print("\n❌ Redaction tests failed.")
+        return False
+    
     # Test PDF processing
     if not test_pdf_processing():
         print("\n❌ PDF processing tests failed.")